@@ -1,1895 +1,1567 @@
-import streamlit as st
-import requests
-from datetime import datetime
-import time
-import pandas as pd
-import matplotlib
-matplotlib.use('Agg')  
-import matplotlib.pyplot as plt
-import base64
-from io import BytesIO
-from fpdf import FPDF
-import tempfile
-
-st.set_page_config(
-    page_title="Gestión de Seguridad y Salud en el Trabajo",
-    page_icon="🛡️",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# URL del backend
-BACKEND_URL = "http://localhost:8000"
-
-# Estado de la sesión
-if 'logged_in' not in st.session_state:
-    st.session_state.logged_in = False
-if 'token' not in st.session_state:
-    st.session_state.token = None
-if 'user_info' not in st.session_state:
-    st.session_state.user_info = {}
-if 'current_page' not in st.session_state:
-    st.session_state.current_page = "inicio"
-if 'empresa_actual' not in st.session_state:
-    st.session_state.empresa_actual = None
-if 'preguntas_verificacion' not in st.session_state:
-    st.session_state.preguntas_verificacion = {}
-if 'previous_page' not in st.session_state:
-    st.session_state.previous_page = None
-
-# Colores principales según la imagen
-COLORES = {
-    "verde_bosque": "#006b3f",
-    "verde_hierba": "#6bbe44",
-    "gris_claro": "#f2f2f2",
-    "gris_oscuro": "#333333",
-    "negro": "#1a1a1a",
-    "blanco": "#ffffff"
-}
-
-# Estilos CSS personalizados con la paleta de colores proporcionada
-def load_css():
-    st.markdown(f"""
-    <style>
-        :root {{
-            --primary: {COLORES["verde_bosque"]};
-            --secondary: {COLORES["verde_hierba"]};
-            --accent: {COLORES["verde_hierba"]};
-            --background: {COLORES["gris_claro"]};
-            --text: {COLORES["negro"]};
-            --header-text: {COLORES["blanco"]};
-        }}
-        
-        body {{
-            background-color: var(--background);
-            color: var(--text);
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        }}
-        
-        .stApp {{
-            background: {COLORES["gris_claro"]};
-        }}
-        
-        .header {{
-            background-color: {COLORES["verde_bosque"]};
-            color: {COLORES["blanco"]};
-            padding: 1rem;
-            margin-bottom: 2rem;
-            border-radius: 0 0 10px 10px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .header-title {{
-            color: {COLORES["blanco"]};
-            font-size: 1.8rem;
-            font-weight: 700;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .header-subtitle {{
-            color: {COLORES["blanco"]};
-            font-size: 1.1rem;
-            opacity: 0.9;
-        }}
-        
-        .stButton>button {{
-            background-color: var(--primary);
-            color: white;
-            border-radius: 8px;
-            padding: 0.5rem 1rem;
-            border: none;
-            font-weight: 500;
-            transition: all 0.3s ease;
-        }}
-        
-        .stButton>button:hover {{
-            background-color: var(--accent);
-            color: white;
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }}
-        
-        .back-button {{
-            background-color: {COLORES["gris_claro"]} !important;
-            color: var(--primary) !important;
-            border: 1px solid var(--primary) !important;
-        }}
-        
-        .back-button:hover {{
-            background-color: #e8f5e9 !important;
-        }}
-        
-        .stTextInput>div>div>input, 
-        .stTextArea>div>div>textarea, 
-        .stSelectbox>div>div>select,
-        .stNumberInput>div>div>input {{
-            border-radius: 8px;
-            border: 1px solid {COLORES["verde_hierba"]};
-            padding: 0.5rem;
-            box-shadow: 0 1px 2px rgba(0,0,0,0.05);
-        }}
-        
-        .sidebar .sidebar-content {{
-            background-color: var(--primary);
-            color: white;
-            padding: 1rem;
-        }}
-        
-        h1, h2, h3, h4 {{
-            color: var(--primary);
-            margin-top: 0;
-        }}
-        
-        .custom-card {{
-            background-color: white;
-            border-radius: 10px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            margin-bottom: 1.5rem;
-            border-left: 4px solid var(--accent);
-        }}
-        
-        .pregunta-card {{
-            background-color: #f8f9fa;
-            border-left: 4px solid {COLORES["verde_hierba"]};
-            border-radius: 8px;
-            padding: 1rem;
-            margin-bottom: 1rem;
-            transition: all 0.3s ease;
-        }}
-        
-        .pregunta-card:hover {{
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-            transform: translateY(-2px);
-        }}
-        
-        .pregunta-header {{
-            color: {COLORES["verde_bosque"]};
-            font-weight: 600;
-            margin-bottom: 0.5rem;
-            font-size: 1.1rem;
-        }}
-        
-        .normativa-text {{
-            font-size: 0.85rem;
-            color: #666;
-            font-style: italic;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .gestion-text {{
-            font-size: 0.9rem;
-            font-weight: 500;
-            color: {COLORES["verde_bosque"]};
-            margin-bottom: 0.5rem;
-        }}
-        
-        .observaciones-box {{
-            background-color: #fff8e1;
-            border-radius: 6px;
-            padding: 0.75rem;
-            margin-top: 0.75rem;
-            border-left: 3px solid #FFC107;
-        }}
-        
-        .success {{ color: {COLORES["verde_bosque"]}; }}
-        .warning {{ color: #FF8F00; }}
-        .error {{ color: #C62828; }}
-        
-        .stRadio>div>label {{
-            margin-right: 1rem;
-        }}
-        
-        .st-expander {{
-            background-color: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-        }}
-        
-        .st-expander .streamlit-expanderHeader {{
-            font-weight: 600;
-            color: var(--primary);
-        }}
-        
-        .metric-card {{
-            background-color: white;
-            border-radius: 10px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            margin-bottom: 1rem;
-            border-left: 4px solid var(--accent);
-        }}
-        
-        .verification-table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-bottom: 1rem;
-        }}
-        
-        .verification-table th {{
-            background-color: {COLORES["verde_bosque"]};
-            color: white;
-            padding: 0.5rem;
-            text-align: left;
-        }}
-        
-        .verification-table td {{
-            padding: 0.5rem;
-            border: 1px solid #ddd;
-        }}
-        
-        .verification-table tr:nth-child(even) {{
-            background-color: #f2f2f2;
-        }}
-        
-        .planes-section {{
-            background-color: {COLORES["gris_claro"]};
-            padding: 2rem;
-            border-radius: 10px;
-            margin-top: 2rem;
-            text-align: center;
-        }}
-        
-        .planes-title {{
-            color: {COLORES["verde_bosque"]};
-            font-size: 1.5rem;
-            margin-bottom: 1rem;
-            font-weight: 600;
-        }}
-        
-        .planes-subtitle {{
-            color: {COLORES["negro"]};
-            font-size: 1.1rem;
-            margin-bottom: 1.5rem;
-        }}
-        
-        .plan-card {{
-            background-color: white;
-            border-radius: 10px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            margin: 1rem;
-            border-top: 4px solid {COLORES["verde_hierba"]};
-            transition: all 0.3s ease;
-        }}
-        
-        .plan-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 8px 15px rgba(0,0,0,0.1);
-        }}
-        
-        .plan-name {{
-            color: {COLORES["verde_bosque"]};
-            font-size: 1.2rem;
-            font-weight: 600;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .plan-price {{
-            color: {COLORES["verde_hierba"]};
-            font-size: 1.5rem;
-            font-weight: 700;
-            margin-bottom: 1rem;
-        }}
-        
-        .plan-features {{
-            text-align: left;
-            margin-bottom: 1.5rem;
-        }}
-        
-        .feature-item {{
-            margin-bottom: 0.5rem;
-            display: flex;
-            align-items: center;
-        }}
-        
-        .feature-icon {{
-            color: {COLORES["verde_hierba"]};
-            margin-right: 0.5rem;
-        }}
-    </style>
-    """, unsafe_allow_html=True)
-
-load_css()
-
-def show_header():
-    st.markdown(f"""
-    <div class="header">
-        <div class="header-title">GESTIÓN DE SEGURIDAD Y SALUD EN EL TRABAJO</div>
-        <div class="header-subtitle">CONSULTA NUESTROS PLANES EMPRESARIALES Y PREMIUM</div>
-        <div class="header-subtitle">PARA EMPRESAS PEQUEÑAS, MEDIANAS Y GRANDES CON TODO TIPO DE MESSOS.</div>
-    </div>
-    """, unsafe_allow_html=True)
-
-def go_back():
-    if st.session_state.previous_page:
-        st.session_state.current_page = st.session_state.previous_page
-        st.rerun()
-    else:
-        st.session_state.current_page = "dashboard"
-        st.rerun()
-
-# Página de inicio de sesión
-def login_page():
-    show_header()
-    
-    st.markdown("### Desafío")
-    st.markdown("""
-    Bienvenido al sistema de gestión de seguridad y salud en el trabajo. 
-    Por favor inicie sesión para acceder a todas las funcionalidades.
-    """)
-    
-    col1, col2 = st.columns([1, 2])
-    
-    with col1:
-        st.image("https://via.placeholder.com/300x200?text=Logo+Empresa", width=250)
-    
-    with col2:
-        with st.form("login_form"):
-            cedula = st.text_input("Cédula", placeholder="Ingrese su número de cédula", key="cedula_input")
-            password = st.text_input("Contraseña", type="password", placeholder="Ingrese su contraseña", key="password_input")
-            submit_button = st.form_submit_button("Iniciar Sesión", type="primary")
-            
-            if submit_button:
-                try:
-                    response = requests.post(
-                        f"{BACKEND_URL}/token",
-                        data={"username": cedula, "password": password},
-                        headers={"Content-Type": "application/x-www-form-urlencoded"}
-                    )
-                    if response.status_code == 200:
-                        data = response.json()
-                        st.session_state.logged_in = True
-                        st.session_state.token = data["access_token"]
-                        st.session_state.user_info = {
-                            "nombre": data["nombre"],
-                            "cedula": cedula,
-                            "rol": data.get("rol", "inspector")
-                        }
-                        st.session_state.current_page = "dashboard"
-                        st.rerun()
-                    else:
-                        st.error("Cédula o contraseña incorrecta")
-                except requests.exceptions.RequestException as e:
-                    st.error(f"Error al conectar con el servidor: {str(e)}")
-
-# Página principal
-def dashboard_page():
-    show_header()
-    
-    st.sidebar.title("Menú Principal")
-    st.sidebar.markdown(f"""
-    **Usuario:** {st.session_state.user_info['nombre']}  
-    **Rol:** {st.session_state.user_info['rol'].capitalize()}
-    """)
-    
-    menu_options = {
-        "🏠 Inicio": "dashboard",
-        "🏢 Gestión de Empresas": "gestion_empresas",
-        "📋 Formulario de Verificación": "formulario_verificacion",
-        "📊 Reportes y Estadísticas": "reportes"
-    }
-    
-    for option, page in menu_options.items():
-        if st.sidebar.button(option, key=f"menu_{page}"):
-            st.session_state.previous_page = st.session_state.current_page
-            st.session_state.current_page = page
-            st.rerun()
-    
-    if st.sidebar.button("🔒 Cerrar Sesión", type="primary"):
-        st.session_state.logged_in = False
-        st.session_state.token = None
-        st.session_state.current_page = "inicio"
-        st.rerun()
-    
-    st.title(f"Bienvenido, {st.session_state.user_info['nombre']}")
-    st.markdown("---")
-    
-    st.markdown("""
-    ### Sistema Integral de Gestión de Seguridad y Salud en el Trabajo
-    
-    Ofrecemos soluciones completas para la gestión y verificación del cumplimiento 
-    de normativas de seguridad en el ambiente laboral para empresas de todos los tamaños.
-    """)
-    
-    # Sección de planes empresariales
-    st.markdown("""
-    <div class="planes-section">
-        <div class="planes-title">NUESTROS PLANES EMPRESARIALES</div>
-        <div class="planes-subtitle">Soluciones adaptadas a las necesidades de su empresa</div>
-        
-        <div style="display: flex; justify-content: center; flex-wrap: wrap;">
-            <div class="plan-card" style="flex: 1; min-width: 300px;">
-                <div class="plan-name">PLAN BÁSICO</div>
-                <div class="plan-price">$99/mes</div>
-                <div class="plan-features">
-                    <div class="feature-item"><span class="feature-icon">✓</span> Hasta 10 trabajadores</div>
-                    <div class="feature-item"><span class="feature-icon">✓</span> Gestión documental básica</div>
-                    <div class="feature-item"><span class="feature-icon">✓</span> Soporte por correo</div>
-                </div>
-                <button class="stButton">Contratar</button>
-            </div>
-            
-            <div class="plan-card" style="flex: 1; min-width: 300px;">
-                <div class="plan-name">PLAN EMPRESARIAL</div>
-                <div class="plan-price">$199/mes</div>
-                <div class="plan-features">
-                    <div class="feature-item"><span class="feature-icon">✓</span> Hasta 50 trabajadores</div>
-                    <div class="feature-item"><span class="feature-icon">✓</span> Gestión documental completa</div>
-                    <div class="feature-item"><span class="feature-icon">✓</span> Soporte prioritario</div>
-                    <div class="feature-item"><span class="feature-icon">✓</span> Informes mensuales</div>
-                </div>
-                <button class="stButton">Contratar</button>
-            </div>
-            
-            <div class="plan-card" style="flex: 1; min-width: 300px;">
-                <div class="plan-name">PLAN PREMIUM</div>
-                <div class="plan-price">$399/mes</div>
-                <div class="plan-features">
-                    <div class="feature-item"><span class="feature-icon">✓</span> Trabajadores ilimitados</div>
-                    <div class="feature-item"><span class="feature-icon">✓</span> Gestión integral</div>
-                    <div class="feature-item"><span class="feature-icon">✓</span> Soporte 24/7</div>
-                    <div class="feature-item"><span class="feature-icon">✓</span> Auditorías periódicas</div>
-                    <div class="feature-item"><span class="feature-icon">✓</span> Capacitaciones incluidas</div>
-                </div>
-                <button class="stButton">Contratar</button>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-load_css()
-
-def go_back():
-    if st.session_state.previous_page:
-        st.session_state.current_page = st.session_state.previous_page
-        st.rerun()
-    else:
-        st.session_state.current_page = "dashboard"
-        st.rerun()
-
-# Página de inicio de sesión
-def login_page():
-    col1, col2 = st.columns([1, 2])
-    
-    with col1:
-        st.image("https://via.placeholder.com/300x200?text=SESACO+Logo", width=250)
-    
-    with col2:
-        st.title("SESACO - Seguridad Industrial S.A.")
-        st.markdown("---")
-        
-        with st.form("login_form"):
-            cedula = st.text_input("Cédula", placeholder="1722212253", key="cedula_input")
-            password = st.text_input("Contraseña", type="password", placeholder="1722212253", key="password_input")
-            submit_button = st.form_submit_button("Iniciar Sesión", type="primary")
-            
-            if submit_button:
-                try:
-                    response = requests.post(
-                        f"{BACKEND_URL}/token",
-                        data={"username": cedula, "password": password},
-                        headers={"Content-Type": "application/x-www-form-urlencoded"}
-                    )
-                    if response.status_code == 200:
-                        data = response.json()
-                        st.session_state.logged_in = True
-                        st.session_state.token = data["access_token"]
-                        st.session_state.user_info = {
-                            "nombre": data["nombre"],
-                            "cedula": cedula,
-                            "rol": data.get("rol", "inspector")
-                        }
-                        st.session_state.current_page = "dashboard"
-                        st.rerun()
-                    else:
-                        st.error("Cédula o contraseña incorrecta")
-                except requests.exceptions.RequestException as e:
-                    st.error(f"Error al conectar con el servidor: {str(e)}")
-
-# Página principal
-def dashboard_page():
-    st.sidebar.title("Menú Principal")
-    st.sidebar.markdown(f"""
-    **Usuario:** {st.session_state.user_info['nombre']}  
-    **Rol:** {st.session_state.user_info['rol'].capitalize()}
-    """)
-    
-    menu_options = {
-        "🏠 Inicio": "dashboard",
-        "🏢 Gestión de Empresas": "gestion_empresas",
-        "📋 Formulario de Verificación": "formulario_verificacion",
-        "📊 Reportes y Estadísticas": "reportes"
-    }
-    
-    for option, page in menu_options.items():
-        if st.sidebar.button(option, key=f"menu_{page}"):
-            st.session_state.previous_page = st.session_state.current_page
-            st.session_state.current_page = page
-            st.rerun()
-    
-    if st.sidebar.button("🔒 Cerrar Sesión", type="primary"):
-        st.session_state.logged_in = False
-        st.session_state.token = None
-        st.session_state.current_page = "inicio"
-        st.rerun()
-    
-    st.title(f"Bienvenido, {st.session_state.user_info['nombre']}")
-    st.markdown("---")
-    
-    st.markdown("""
-    ### Sistema Integral de Verificación de Seguridad Industrial
-    
-    **SESACO Seguridad Industrial S.A.** ofrece soluciones completas para la gestión y verificación 
-    del cumplimiento de normativas de seguridad en el ambiente laboral.
-    """)
-    
-    # Tarjeta de métricas
-    with st.container():
-        st.markdown("""
-        <div class='custom-card'>
-        """, unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        col1.metric("Empresas Registradas", "28", "+3 este mes")
-        col2.metric("Verificaciones", "156", "15% más que el mes pasado")
-        col3.metric("Cumplimiento Promedio", "82%", "5% mejor que el promedio")
-        
-        st.markdown("</div>", unsafe_allow_html=True)
-    
-    st.markdown("### Acciones Rápidas")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if st.button("🔍 Buscar Empresa", use_container_width=True):
-            st.session_state.previous_page = st.session_state.current_page
-            st.session_state.current_page = "gestion_empresas"
-            st.rerun()
-    
-    with col2:
-        if st.button("📝 Nuevo Formulario", use_container_width=True):
-            st.session_state.previous_page = st.session_state.current_page
-            st.session_state.current_page = "formulario_verificacion"
-            st.rerun()
-    
-    with col3:
-        if st.button("📊 Generar Reporte", use_container_width=True):
-            st.session_state.previous_page = st.session_state.current_page
-            st.session_state.current_page = "reportes"
-            st.rerun()
-
-# Gestión de empresas
-def gestion_empresas_page():
-    if st.button("← Regresar", key="back_gestion", type="secondary", use_container_width=True, 
-                help="Volver a la página anterior", on_click=go_back):
-        return
-    
-    st.title("🏢 Gestión de Empresas")
-    st.markdown("---")
-    
-    tab1, tab2 = st.tabs(["🔍 Buscar Empresa", "➕ Registrar Nueva Empresa"])
-    
-    with tab1:
-        st.subheader("Buscar Empresa por RUC")
-        ruc = st.text_input("Ingrese el RUC de la empresa", key="buscar_ruc")
-        
-        if st.button("Buscar", key="buscar_empresa_btn"):
-            if ruc:
-                try:
-                    response = requests.get(
-                        f"{BACKEND_URL}/empresas/{ruc}",
-                        headers={"Authorization": f"Bearer {st.session_state.token}"}
-                    )
-                    if response.status_code == 200:
-                        empresa = response.json()
-                        st.session_state.empresa_actual = empresa
-                        st.success("Empresa encontrada")
-                    else:
-                        st.warning("No se encontró una empresa con ese RUC")
-                except requests.exceptions.RequestException:
-                    st.error("Error al conectar con el servidor")
-            else:
-                st.warning("Por favor ingrese un RUC")
-        
-        if 'empresa_actual' in st.session_state and st.session_state.empresa_actual:
-            display_empresa_info(st.session_state.empresa_actual)
-    
-    with tab2:
-        st.subheader("Registrar Nueva Empresa")
-        with st.form("empresa_form", clear_on_submit=True):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                inspeccion = st.text_input("Inspección")
-                fecha = st.date_input("Fecha")
-                re_inspeccion = st.text_input("Re-inspección", placeholder="Ej: L-V 01/01/2000")
-                fecha_inspeccion = st.date_input("Fecha de Re-inspección")
-                fecha_informacion = st.text_input("Fecha Máxima para remitir información", placeholder="Ej: L-V 01/01/2000")
-                tipo_empresa = st.selectbox("Tipo de Empresa", ["Privada", "Pública"])
-                empleador = st.text_input("Empleador")
-                razon_social = st.text_input("Razón Social*", help="Nombre legal de la empresa")
-                ruc = st.text_input("RUC*", help="Número de RUC de 13 dígitos")
-                telefono = st.text_input("Número de Teléfono")
-                correo = st.text_input("Correo Electrónico")
-                actividad_economica = st.text_input("Actividad Económica Principal")
-                
-            with col2:
-                tipo_centro = st.selectbox("Tipo de Centro de Trabajo*", ["Matriz", "Sucursal"])
-                direccion = st.text_area("Dirección del Centro de Trabajo*")
-                total_trabajadores = st.number_input("Total de Trabajadores/Servidores*", min_value=1, value=200)
-                num_trabajadores_centro = st.number_input("Número de Trabajadores/Servidores del Centro de Trabajo*", min_value=1, value=10)
-                consolidado_planilla = st.selectbox("Consolidado de Planilla IESS*", ["Sí", "No"])
-                
-                st.subheader("Estadísticas de Trabajadores", divider="green")
-                col3, col4 = st.columns(2)
-                with col3:
-                    hombres = st.number_input("Hombres", min_value=0, value=0)
-                    mujeres = st.number_input("Mujeres", min_value=0, value=0)
-                    embarazadas = st.number_input("Embarazadas", min_value=0, value=0)
-                    mujeres_en_lactancia = st.number_input("Mujeres en Lactancia", min_value=0, value=0)
-                    extranjeros = st.number_input("Extranjeros", min_value=0, value=0)
-                    adolescentes = st.number_input("Adolescentes", min_value=0, value=0)
-                
-                with col4:
-                    teletrabajadores = st.number_input("Teletrabajadores", min_value=0, value=0)
-                    niños = st.number_input("Menores de edad", min_value=0, value=0)
-                    adultos_mayores = st.number_input("Adultos Mayores", min_value=0, value=0)
-                
-                numeros_centros_abiertos = st.text_input("Número de Centros de Trabajo Abiertos")
-                horario_trabajo = st.text_input("Horario de Trabajo Principal", placeholder="Ej: L-V 08:00-17:00")
-                entrevistados = st.text_area("Personas Entrevistadas (separar por comas)").split(",")
-                
-            if st.form_submit_button("Registrar Empresa", type="primary"):
-                if not all([ruc, razon_social, tipo_centro, direccion]):
-                    st.error("Por favor complete los campos obligatorios (*)")
-                else:
-                    estadisticas = {
-                        "hombres": hombres,
-                        "mujeres": mujeres,
-                        "embarazadas": embarazadas,
-                        "teletrabajadores": teletrabajadores,
-                        "niños": niños,
-                        "adultos_mayores": adultos_mayores,
-                        "mujeres_en_lactancia": mujeres_en_lactancia,
-                        "extranjeros": extranjeros,
-                        "adolescentes": adolescentes
-                    }
-                    
-                    empresa_data = {
-                        "inspeccion": inspeccion,
-                        "fecha": str(fecha) if fecha else None,
-                        "re_inspeccion": re_inspeccion,
-                        "fecha_inspeccion": str(fecha_inspeccion) if fecha_inspeccion else None,
-                        "fecha_informacion": fecha_informacion,
-                        "tipo": tipo_empresa,
-                        "empleador": empleador,
-                        "razon_social": razon_social,
-                        "ruc": ruc,
-                        "telefono": telefono,
-                        "correo": correo,
-                        "actividad_economica": actividad_economica,
-                        "tipo_centro": tipo_centro,
-                        "direccion": direccion,
-                        "total_trabajadores": total_trabajadores,
-                        "num_trabajadores_centro": num_trabajadores_centro,
-                        "consolidado_planilla": consolidado_planilla == "Sí",
-                        "estadisticas": estadisticas,
-                        "horario_trabajo": horario_trabajo,
-                        "entrevistados": [e.strip() for e in entrevistados if e.strip()],
-                        "numeros_centros_abiertos": numeros_centros_abiertos
-                    }
-                    
-                    try:
-                        response = requests.post(
-                            f"{BACKEND_URL}/empresas/",
-                            json=empresa_data,
-                            headers={"Authorization": f"Bearer {st.session_state.token}"}
-                        )
-                        if response.status_code == 200:
-                            st.success("✅ Empresa registrada exitosamente!")
-                            time.sleep(2)
-                            st.session_state.empresa_actual = response.json()
-                            st.rerun()
-                        else:
-                            st.error(f"Error al registrar empresa: {response.text}")
-                    except requests.exceptions.RequestException:
-                        st.error("Error al conectar con el servidor")
-
-def display_empresa_info(empresa):
-    st.markdown(f"""
-    <div class='custom-card'>
-        <h3>📋 {empresa['razon_social']}</h3>
-        <p><small>RUC: {empresa['ruc']} | Registrada el: {empresa['fecha_registro'].split('T')[0]}</small></p>
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown(f"**Tipo:** {empresa['tipo']}")
-        st.markdown(f"**Empleador:** {empresa['empleador']}")
-        st.markdown(f"**Teléfono:** {empresa['telefono']}")
-        st.markdown(f"**Correo:** {empresa['correo']}")
-        st.markdown(f"**Actividad Económica:** {empresa['actividad_economica']}")
-        st.markdown(f"**Tipo de Centro:** {empresa['tipo_centro']}")
-    
-    with col2:
-        st.markdown(f"**Dirección:** {empresa['direccion']}")
-        st.markdown(f"**Total Trabajadores:** {empresa['total_trabajadores']}")
-        st.markdown(f"**Planilla IESS:** {'Sí' if empresa['consolidado_planilla'] else 'No'}")
-        st.markdown(f"**Horario:** {empresa['horario_trabajo']}")
-        st.markdown(f"**Entrevistados:** {', '.join(empresa['entrevistados'])}")
-    
-    st.markdown("---")
-    st.subheader("📊 Estadísticas de Trabajadores")
-    
-    estadisticas = empresa['estadisticas']
-    df_estadisticas = pd.DataFrame.from_dict(estadisticas, orient='index', columns=['Cantidad'])
-    st.bar_chart(df_estadisticas)
-    
-    st.markdown("</div>", unsafe_allow_html=True)
-
-def formulario_verificacion_page():
-    if st.button("← Regresar", key="back_formulario", type="secondary", use_container_width=True, 
-                help="Volver a la página anterior", on_click=go_back):
-        return
-    
-    st.title("📋 Formulario de Verificación")
-    st.markdown("---")
-    
-    # Paso 1: Seleccionar empresa
-    st.subheader("1. Seleccione la empresa a verificar")
-    ruc = st.text_input("Ingrese el RUC de la empresa", key="form_ruc_input")
-    
-    if st.button("Cargar Empresa", key="cargar_empresa_btn"):
-        if ruc:
-            try:
-                response = requests.get(
-                    f"{BACKEND_URL}/empresas/{ruc}",
-                    headers={"Authorization": f"Bearer {st.session_state.token}"}
-                )
-                if response.status_code == 200:
-                    empresa = response.json()
-                    st.session_state.empresa_actual = empresa
-                    st.success(f"Empresa cargada: {empresa['razon_social']}")
-                else:
-                    st.warning("No se encontró una empresa con ese RUC")
-            except requests.exceptions.RequestException:
-                st.error("Error al conectar con el servidor")
-        else:
-            st.warning("Por favor ingrese un RUC")
-    
-    if 'empresa_actual' in st.session_state and st.session_state.empresa_actual:
-        empresa = st.session_state.empresa_actual
-        display_empresa_info(empresa)
-        
-        # Paso 2: Cargar estructura del formulario
-        st.subheader("2. Complete el formulario de verificación")
-
-        # Definir la estructura del formulario
-        PREGUNTAS_SST = {
-            "gestion_administrativa": {
-                "title": "Gestión Administrativa",
-                "questions": [
-                    {
-                        "id": "ga1",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Art. 4 y Art.18. Decisión 584 (2004) Art. 11. Código del Trabajo (2005) Art. 434.",
-                        "pregunta": "¿Cuenta con un Plan de Prevención de Riesgos Laborales (hasta 9 trabajadores) aprobado y registrado en el SUT?",
-                        "requisitos": "Documento aprobado por la máxima autoridad y registrado en el Sistema Único de Trabajo (SUT)"
-                    },
-                    {
-                        "id": "ga2",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Art. 4, 19. Decisión 584 (2004) Art. 11. Decreto Ejecutivo 256 (2024) Art. 19.",
-                        "pregunta": "¿Cuenta con un Reglamento de Higiene y seguridad (más de 10 trabajadores) aprobado y registrado en el SUT?",
-                        "requisitos": "Debe contener: Política de SST, organización, responsabilidades, procedimientos y registros obligatorios"
-                    },
-                    {
-                        "id": "ga3",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Art. 18 y 19. Decreto Ejecutivo 256 (2024) Art. 20.",
-                        "pregunta": "¿Se ha socializado a todos los trabajadores la Política de seguridad y salud en el trabajo?",
-                        "requisitos": "Evidencia de socialización (actas, registros de asistencia, comunicados)"
-                    },
-                    {
-                    "id": "ga4",
-                    "normativa": "Acuerdo Ministerial 196 (2024) Art. 18 y 19. Decreto Ejecutivo 256 (2024) Art. 25.",
-                    "pregunta": "¿Cuenta con el registro del Modelo de Seguridad e Higiene del Trabajo en la Plataforma SUT?",
-                    "requisitos": "Captura de pantalla del registro vigente en el SUT"
-                    },
-                    {
-                    "id": "ga5",
-                    "normativa": "Acuerdo Ministerial 196 (2024) Art. 14",
-                    "pregunta": "¿Cuenta con el registro del Texto del Trabajo en la Plataforma SUT?",
-                    "requisitos": "Documento que contenga las condiciones de trabajo registrado en el SUT"
-                    },
-                    {
-                    "id": "ga6",
-                    "normativa": "Decreto Ejecutivo 256 (2024) Art. 21.",
-                    "pregunta": "¿Cuenta con el registro del Servicio Externo de Seguridad e Higiene del Trabajo en la Plataforma SUT?",
-                    "requisitos": "Contrato vigente y registro en SUT del servicio externo"
-                    },
-                    {
-                    "id": "ga7",
-                    "normativa": "Decreto Ejecutivo 256 (2024) Art. 33.",
-                    "pregunta": "¿Cuenta con informe de actividades realizadas por técnico o servicio externo de seguridad e higiene del trabajo?",
-                    "requisitos": "Informe con: Objetivo, estadísticas básicas, actividades ejecutadas, horas de gestión, conclusiones, fotos y firmas"
-                    },
-                    {
-                    "id": "ga8",
-                    "normativa": "Decreto Ejecutivo 256 (2024) Art. 32.",
-                    "pregunta": "¿Cuenta con el registro del profesional médico en la Plataforma SUT?",
-                    "requisitos": "Registro vigente del médico ocupacional en el SUT"
-                    },
-                    {
-                    "id": "ga9",
-                    "normativa": "Resolución 657 (2008) Art. 10, 13, 14.",
-                    "pregunta": "¿Cuenta con el registro del Delegado de Seguridad y Salud en la plataforma SUT?",
-                    "requisitos": "Acta de elección y registro en SUT del delegado"
-                    },
-                    {
-                    "id": "ga10",
-                    "normativa": "Decreto Ejecutivo 256 (2024) Art. 36. Art. 38.",
-                    "pregunta": "¿Cuenta con el registro del Comité de Seguridad y Salud en la plataforma SUT?",
-                    "requisitos": "Acta de constitución y registro en SUT del comité"
-                }
-            ]
-         },
-            "gestion_tecnica": {
-                "title": "Gestión Técnica",
-                "questions": [
-                    {
-                        "id": "gt1",
-                        "normativa": "Decisión 584. Art. 11. Art. 19. Código del Trabajo Art. 42. Decreto Ejecutivo 255 (2024) Art. 28.",
-                        "pregunta": "¿Se dispone de un descriptivo por puesto de trabajo?",
-                        "requisitos": "Debe incluir: N° de trabajadores, actividades, tareas específicas, horas diarias, recursos utilizados (máquinas, equipos, agentes químicos/biológicos)"
-                    },  
-                    {
-                        "id": "gt2",
-                        "normativa": "Decisión 584. Art. 11.",
-                        "pregunta": "¿Cuenta con un mapa de riesgos del lugar, y/o, centro de trabajo?",
-                        "requisitos": "Debe contener: Señalización de SST, EPP, dispositivos de parada de emergencia"
-                    },
-                    {
-                        "id": "gt3",
-                        "normativa": "Decisión 584 (2004) Art. 11. Resolución 957 (2008) Art. 1. Decreto Ejecutivo 255 (2024) Art. 27 y 28, 47.",
-                        "pregunta": "¿Cuenta con una matriz de identificación de peligros y evaluación de riesgos laborales por puesto de trabajo con metodología reconocida?",
-                        "requisitos": "Matriz con metodología validada (INSHT, NTP, ISO, etc.)"
-                    },
-                    {
-                        "id": "gt4",
-                        "normativa": "Decisión 584 (2004) Art. 11,12, 18. Resolución 957 (2008) Art. 1. Decreto Ejecutivo 255 (2024) Art. 48 Acuerdo Ministerial 196 (2024)",
-                        "pregunta": "¿Cuenta con informe de medición de agentes físico, químico y/o biológico del puesto de trabajo?",
-                        "requisitos": "Informe con: Fecha, puesto, trabajadores expuestos, agente, metodología, resultados, comparación con normativa, firmas, certificados de calibración, fotos"
-                    },
-                    {
-                        "id": "gt5",
-                        "normativa": "Decisión 584 (2004) Art. 11, 12, 18 Resolución 957 (2008) Art. 1 Decreto Ejecutivo 255 (2024) Art. 44, 45 y 46. Acuerdo Ministerial 196 (2024).",
-                        "pregunta": "¿Cuenta con informe de evaluación de riesgos de seguridad, ergonómicos y psicosociales?",
-                        "requisitos": "Informe con: Fecha, puesto, trabajadores, riesgo identificado, metodología, resultados, comparación normativa, firmas, fotos"
-                    },
-                    {
-                        "id": "gt6",
-                        "normativa": "Decisión 584 (2004) Art. 11 Resolución 957 (2008) Art. 1 Código del Trabajo Art. 412 Decreto Ejecutivo 255 (2024) Art. 49",
-                        "pregunta": "¿Cuenta con informe de medidas de prevención y protección implementadas por puesto de trabajo?",
-                        "requisitos": "Informe con: Fecha, medidas implementadas (eliminación, sustitución, controles), fechas implementación, resultados, seguimiento, firmas, fotos"
-                    },
-                    {
-                        "id": "gt7",
-                        "normativa": "Resolución 957 (2008) Art. 1.",
-                        "pregunta": "¿Cuenta con el cálculo del riesgo residual en la matriz de identificación de peligros?",
-                        "requisitos": "Matriz actualizada con valoración de riesgo residual post-implementación de controles"
-                    },
-                    {
-                        "id": "gt8",
-                        "normativa": "Decisión 584 (2004) Art. 11.",
-                        "pregunta": "¿Se ha verificado in situ la implementación de medidas de prevención y protección?",
-                        "requisitos": "Checklist o informe de verificación con evidencias fotográficas"
-                    },
-                    {
-                        "id": "gt9",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Se ha realizado la limpieza y mantenimiento periódico de luminarias?",
-                        "requisitos": "Registro de mantenimiento con fechas y responsables"
-                    },
-                    {
-                        "id": "gt10",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Se ha realizado mantenimiento periódico de los sistemas de ventilación?",
-                        "requisitos": "Registro de mantenimiento y mediciones de calidad de aire"
-                    },
-                    {
-                        "id": "gt11",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Se han clasificado los agentes químicos según su categorización de peligros?",
-                        "requisitos": "Inventario de químicos con clasificación GHS"
-                    },
-                    {
-                        "id": "gt12",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Los recipientes con agentes químicos cuentan con tapas adecuadas?",
-                        "requisitos": "Verificación visual de recipientes correctamente cerrados"
-                    },
-                    {
-                        "id": "gt13",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Se almacenan agentes químicos en áreas específicas según su compatibilidad?",
-                        "requisitos": "Áreas de almacenamiento segregadas según compatibilidad química"
-                    },
-                    {
-                        "id": "gt14",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Se dispone de fichas de datos de seguridad de los agentes químicos accesibles?",
-                        "requisitos": "Fichas SDS actualizadas y en lugar accesible para trabajadores"
-                    },
-                    {
-                        "id": "gt15",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Se ha etiquetado adecuadamente los agentes químicos con información en español?",
-                        "requisitos": "Etiquetas con pictogramas, frases H y P, en español"
-                    },
-                    {
-                        "id": "gt16",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Se aplican lineamientos de transporte, almacenamiento y manejo de productos químicos?",
-                        "requisitos": "Procedimientos documentados y evidencias de cumplimiento"
-                    },
-                    {
-                        "id": "gt17",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Se aplican medidas de bioseguridad para agentes biológicos?",
-                        "requisitos": "Protocolos de bioseguridad según nivel de riesgo"
-                    },
-                    {
-                        "id": "gt18",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Se ha dispuesto área específica para desechos biológicos?",
-                        "requisitos": "Área con contenedores diferenciados y protocolos de disposición"
-                    },
-                    {
-                        "id": "gt19",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Se ha implementado control de plagas y vectores?",
-                        "requisitos": "Contrato o registros de control de plagas"
-                    },
-                    {
-                        "id": "gt20",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Los lugares de trabajo se encuentran ordenados y limpios?",
-                        "requisitos": "Verificación visual de condiciones de orden y limpieza"
-                    },
-                    {
-                        "id": "gt21",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Las áreas de circulación cuentan con niveles mínimos de iluminación?",
-                        "requisitos": "Mediciones de iluminación según NTE INEN 2 250"
-                    },
-                    {
-                        "id": "gt22",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Se han delimitado áreas para circulación del personal y/o vehículos?",
-                        "requisitos": "Marcaje visible de zonas de circulación"
-                    },
-                    {
-                        "id": "gt23",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Se han delimitado áreas para emplazamiento de máquinas?",
-                        "requisitos": "Áreas señalizadas para ubicación de equipos"
-                    },
-                    {
-                        "id": "gt24",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Las rampas están diseñadas conforme a la norma?",
-                        "requisitos": "Cumplimiento de pendientes y medidas de seguridad"
-                    },
-                    {
-                        "id": "gt25",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿La estructura de prevención contra caídas está en buen estado?",
-                        "requisitos": "Inspección de barandillas, plataformas, escaleras, etc."
-                    },
-                    {
-                        "id": "gt26",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Los dispositivos de parada de emergencia están señalizados y accesibles?",
-                        "requisitos": "Verificación visual de señalización y accesibilidad"
-                    },
-                    {
-                        "id": "gt27",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Las partes móviles de motores y transmisión están protegidas?",
-                        "requisitos": "Verificación de resguardos y protecciones"
-                    },
-                    {
-                        "id": "gt28",
-                        "normativa": "Acuerdo Ministerial 196 (2024) Anexo 3",
-                        "pregunta": "¿Las puertas y salidas están señalizadas y libres de obstáculos?",
-                        "requisitos": "Verificación visual de señalización y despeje"
-                    },
-                    {
-                        "id": "gt29",
-                        "normativa": "NTE INEN-ISO 3864-1.",
-                        "pregunta": "¿Cumple con la normativa de señalización preventiva?",
-                        "requisitos": "Señales amarillas con pictogramas según norma"
-                    },
-                    {
-                        "id": "gt30",
-                        "normativa": "NTE INEN-ISO 3864-1.",
-                        "pregunta": "¿Cumple con la normativa de señalización prohibitiva?",
-                        "requisitos": "Señales rojas con pictogramas según norma"
-                    },
-                    {
-                        "id": "gt31",
-                        "normativa": "NTE INEN-ISO 3864-1.",
-                        "pregunta": "¿Cumple con la normativa de señalización de obligación?",
-                        "requisitos": "Señales azules con pictogramas según norma"
-                    },
-                    {
-                        "id": "gt32",
-                        "normativa": "NTE INEN-ISO 3864-1.",
-                        "pregunta": "¿Cumple con la normativa de señalización de equipos contra incendio?",
-                        "requisitos": "Señales rojas para equipos contra incendio"
-                    },
-                    {
-                        "id": "gt33",
-                        "normativa": "Decreto Ejecutivo 255 (2024) Art. 58. Decisión 584 (2004) Art. 11.",
-                        "pregunta": "¿Existe señalización para evacuación en caso de emergencia?",
-                        "requisitos": "Señalización fotoluminiscente según normativa"
-                    },
-                    {
-                        "id": "gt34",
-                        "normativa": "Decreto Ejecutivo 255 (2024) Art. 58. Decisión 584 (2004) Art. 11.",
-                        "pregunta": "¿Cuenta con procedimiento para trabajos especiales?",
-                        "requisitos": "Procedimiento con: objetivo, responsable, definición de puesto, riesgos, controles, EPP, formato de permiso"
-                    },
-                    {
-                        "id": "gt35",
-                        "normativa": "Decreto Ejecutivo 255 (2024) Art. 58. Decisión 584 (2004) Art. 11.",
-                        "pregunta": "¿Se emiten los permisos de trabajo conforme el procedimiento?",
-                        "requisitos": "Registros de permisos emitidos completos"
-                    },
-                    {
-                        "id": "gt36",
-                        "normativa": "Decreto Ejecutivo 255 (2024) Art. 58 Acuerdo Ministerial (2017) 174. Acuerdo Ministerial (2017) 13.",
-                        "pregunta": "¿Cuenta con registros de apertura y cierre de permisos para trabajos especiales?",
-                        "requisitos": "Registros completos con fechas, responsables y cierres"
-                    }
-                ]
-            },
-            "gestion_talento_humano": {
-                "title": "Gestión del Talento Humano ",
-                "questions": [
-                    {
-                        "id": "gth1",
-                        "normativa": "Constitución de la República del Ecuador (2008) Art. 35. Decisión 584 (2004) Art. 11, 18, 25. Ley Orgánica de Discapacidades (2012) Art. 16, 19, 45, 52. Código del Trabajo (2005) Art. 42.",
-                        "pregunta": "¿Se ha identificado a trabajadores en grupos de atención prioritaria?",
-                        "requisitos": "Adultos mayores, mujeres en lactancia, embarazadas, con discapacidad, enfermedades catastróficas"
-                    },
-                    {
-                        "id": "gth2",
-                        "normativa": "Decisión 584 (2004) Art. 11, 27. Decreto Ejecutivo 255 (2024) Art. 15.",
-                        "pregunta": "¿Se evidencia implementación de medidas para grupos prioritarios?",
-                        "requisitos": "Adaptaciones físicas, horarias o de funciones según necesidades"
-                    },
-                    {
-                        "id": "gth3",
-                        "normativa": "Acuerdo Ministerial (2017) 174. Decreto Ejecutivo 255 (2024) Art. 15.",
-                        "pregunta": "¿Cuenta con certificación de PRL para construcción?",
-                        "requisitos": "Certificado vigente para actividades de alto riesgo"
-                    },
-                    {
-                        "id": "gth4",
-                        "normativa": "Acuerdo Ministerial (2017) 13. Decreto Ejecutivo 255 (2024) Art. 15.",
-                        "pregunta": "¿Cuenta con certificación de PRL para energía eléctrica?",
-                        "requisitos": "Certificado vigente para trabajos eléctricos"
-                    },
-                    {
-                        "id": "gth5",
-                        "normativa": "Reglamento a Ley de Transporte Terrestre, Tránsito y Seguridad Vial (2012) Art. 132. Decreto Ejecutivo 255 (2024) Art. 51.",
-                        "pregunta": "¿El personal que opera vehículos cuenta con licencia adecuada?",
-                        "requisitos": "Licencias vigentes según categoría del vehículo/maquinaria"
-                    },
-                    {
-                        "id": "gth6",
-                        "normativa": "Decisión 584 (2004) Art. 11, 23. Resolución 957 (2008) Art 1. Decreto Ejecutivo 255 (2024) Art. 15.",
-                        "pregunta": "¿Cuenta con registro de asistencia a inducciones de SST?",
-                        "requisitos": "Registro con: fecha, tema, nombres, cédula, firmas, material, evaluación"
-                    },
-                    {
-                        "id": "gth7",
-                        "normativa": "Decisión 584 (2004) Art. 19 Resolución 957 (2008) Art 1.",
-                        "pregunta": "¿Se han efectuado campañas de comunicación en SST?",
-                        "requisitos": "Evidencias de campañas realizadas (fotos, materiales)"
-                    },
-                    {
-                        "id": "gth8",
-                        "normativa": "Decisión 584 (2004) Art. 11, 23. Resolución 957 (2008) Art 1. Decreto Ejecutivo. 255 Art. 15, 16, 28. Acuerdo Ministerial 196 Art. 4.",
-                        "pregunta": "¿Cuenta con programa de formación en SST?",
-                        "requisitos": "Programa con: objetivos, diagnóstico, contenido, cronograma, metodología, duración, responsables"
-                    },
-                    {
-                    "id": "gth9",
-                    "normativa": "Decisión 584 (2004) Art. 11 literal h), i), Art. 23. Resolución 957 (2008) Art 1 literal c). Decreto Ejecutivo 255 (2024) Art. 15, 16,28.",
-                    "pregunta": "¿Cuenta con registro de asistencia a capacitaciones?",
-                    "requisitos": "Registro con: fecha, tema, participantes, firmas, material, evaluación"
-                    },
-                    {
-                    "id": "gth10",
-                    "normativa": "Decisión 584 (2004) Art. 11, 23. Resolución 957 (2008) Art 1. Decreto Ejecutivo 255 (2024) Art. 15, 16, 28.",
-                    "pregunta": "¿Las capacitaciones están registradas en la plataforma SUT?",
-                    "requisitos": "Capturas de pantalla del registro en SUT"
-                    }
-                ]
-            },
-            "procedimientos_operativos": {
-                 "title": "Procedimientos Operativos Básicos ",
-                    "questions": [
-                    {
-                        "id": "po1",
-                        "normativa": "Decisión 584 (2004) Art. 14 y 22. Resolución 957 (2008) Art 5. Reglamento a la LOSEP (2011) Art. 230. Código del Trabajo (2005) Art. 412. Decreto Ejecutivo 255 (2024) Art. 15.",
-                        "pregunta": "¿Cuenta con matriz de exámenes médico ocupacionales por puesto?",
-                        "requisitos": "Matriz con: puesto, n° trabajadores, riesgo, tipo examen, frecuencia, responsable"
-                    },
-                    {
-                        "id": "po2",
-                        "normativa": "Decisión 584 (2004) Art. 14 y 22. Resolución 957 (2008) Art 5. Reglamento a la LOSEP (2011) Art. 230. Código del Trabajo (2005) Art. 412 . Decreto Ejecutivo 255 (2024) Art. 15.",
-                        "pregunta": "¿Cuenta con cronograma de exámenes médico ocupacionales?",
-                        "requisitos": "Cronograma anual con fechas programadas"
-                    },
-                    {
-                        "id": "po3",
-                        "normativa": "Decisión 584 (2004) Art. 14 y 22. Resolución 957 (2008) Art 5. Reglamento a la LOSEP (2011) Art. 230. Código del Trabajo (2005) Art. 412. Decreto Ejecutivo 255 (2024) Art. 15.",
-                        "pregunta": "¿Cuenta con informe de resultados de exámenes médicos?",
-                        "requisitos": "Informe con: fecha, periodo, puesto, n° exámenes, tipo, resultados generales, acciones, firmas"
-                    },
-                    {
-                        "id": "po4",
-                        "normativa": "Decisión 584 (2004) Art. 14 y 22. Resolución 957 (2008) Art 5. Reglamento a la LOSEP (2011) Art. 230. Código del Trabajo (2005) Art. 412. Decreto Ejecutivo (2024) 255 Art. 15.",
-                        "pregunta": "¿Cuenta con certificados de aptitud médica laboral?",
-                        "requisitos": "Certificados con firma del médico y aceptación del trabajador"
-                    },
-                    {
-                        "id": "po5",
-                        "normativa": "Resolución 957 (2008) Art 5. Decreto Ejecutivo 255 (2024) Art. 15.",
-                        "pregunta": "¿Cuenta con informe trimestral de indicadores de salud?",
-                        "requisitos": "Informe con: enfermedad común, profesional y accidentes de trabajo"
-                    },
-                    {
-                        "id": "po6",
-                        "normativa": "Decisión 584 (2004) Art. 11. Resolución 957 (2008) Art. 1, Art. 5. Código del Trabajo (2005) Art. 42. Reglamento a la LOSEP (2011) Art. 230. Resolución del IESS CD 513 (2016), Art. 56.",
-                        "pregunta": "¿Cuenta con procedimiento de investigación de accidentes?",
-                        "requisitos": "Procedimiento con: objetivos, alcance, responsabilidades, metodología, acciones correctivas"
-                    },
-                    {
-                        "id": "po7",
-                        "normativa": "Decisión 584 (2004) Art. 1. Resolución 957 (2008) Art. 15. Resolución del IESS CD 513 (2016) Art. 1, 12, 47.",
-                        "pregunta": "¿Cuenta con registro interno de incidentes y accidentes?",
-                        "requisitos": "Registro con: fecha, hora, trabajador, puesto, lugar, descripción, consecuencias"
-                    },
-                    {
-                        "id": "po8",
-                        "normativa": "Resolución del IESS. CD 513 (2016) Art. 47",
-                        "pregunta": "¿Cuenta con informe de investigación de accidentes?",
-                        "requisitos": "Informe con: fecha, hora, lugar, trabajador, descripción, testigos, causas, acciones"
-                    },
-                    {
-                        "id": "po9",
-                        "normativa": "Resolución del IESS. CD 513 (2016) Art. 44.",
-                        "pregunta": "¿Se ha reportado el accidente a la autoridad competente?",
-                        "requisitos": "Copia del reporte al IESS o autoridad correspondiente"
-                    },
-                    {
-                        "id": "po10",
-                        "normativa": "Resolución del IESS. CD 513 (2016) Art. 63.",
-                        "pregunta": "¿Se han aplicado medidas para evitar nuevos accidentes?",
-                        "requisitos": "Evidencia de implementación de medidas correctivas"
-                    },
-                    {
-                        "id": "po11",
-                        "normativa": "Decisión 584 (2004) Art. 11. Resolución 957 (2008) Art. 5. Código del Trabajo (2005) Art. 42. Reglamento a la LOSEP (2011) Art. 230. Resolución del IESS. CD 513 (2016) Art. 47.",
-                        "pregunta": "¿Cuenta con procedimiento de investigación de enfermedades profesionales?",
-                        "requisitos": "Procedimiento documentado y aprobado"
-                    },
-                    {
-                        "id": "po12",
-                        "normativa": "Resolución del IESS. CD 513 (2016) Art. 45. Código del Trabajo (2005) Art. 42. Acuerdo Ministerial 174 (2008) Art. 11, 136, 137.",
-                        "pregunta": "¿Se ha reportado la presunción de enfermedad profesional?",
-                        "requisitos": "Copia del reporte al IESS"
-                    },
-                    {
-                        "id": "po13",
-                        "normativa": "Resolución del IESS. CD 513 (2016) Art. Código del Trabajo (2005) Art. 42. Resolución 957 (2009) Art.1. Dedición 584 (2004) Art. 4. Decreto Ejecutivo 255 (2024) Art. 28.",
-                        "pregunta": "¿Se han aplicado medidas para evitar nuevas enfermedades profesionales?",
-                        "requisitos": "Evidencia de implementación de medidas correctivas"
-                    },
-                    {
-                        "id": "po14",
-                        "normativa": "Decisión 584 (2004) Art. 16. Resolución 957 (2009) Art. 1. Reglamento de prevención, mitigación y protección contra incendios (2009) Art. 17. Acuerdo Ministerial 174 (2017) Art. 134.",
-                        "pregunta": "¿Cuenta con plan de emergencias implementado?",
-                        "requisitos": "Plan con: objetivos, alcance, amenazas, procedimientos, mapas, cronogramas, brigadas"
-                    },
-                    {
-                        "id": "po15",
-                        "normativa": "Decisión 584 (2004) Art. 11, 23. Resolución 957 (2009) Art.1. Decreto Ejecutivo 255 (2024) Art. 15. Acuerdo Ministerial 196 (2024) Art. 4",
-                        "pregunta": "¿Cuenta con informe anual de simulacros realizados?",
-                        "requisitos": "Informe con: fecha, objetivo, tipo, categoría, duración, participantes, incidentes, lecciones"
-                    },
-                    {
-                        "id": "po16",
-                        "normativa": "Decisión 584 (2004) Art. 11, 23. Resolución 957 (2009) Art. 1, 23. Decreto Ejecutivo 255 (2024) Art. 15. Acuerdo Ministerial 196 Art. 4. Decreto Ejecutivo 255 (2024) Art. 50.",
-                        "pregunta": "¿Se evidencia implementación del plan de emergencia?",
-                        "requisitos": "Evidencias de implementación (fotos, registros)"
-                    },
-                    {
-                        "id": "po17",
-                        "normativa": "Decisión 584 (2004) Art 11 literal c). Decreto Ejecutivo 256 Capítulo II Art. 56",
-                        "pregunta": "¿Cuenta con procedimiento de adquisición de EPP y ropa de trabajo?",
-                        "requisitos": "Procedimiento con: objetivo, alcance, responsabilidades, identificación de necesidades, especificaciones"
-                    },
-                    {
-                        "id": "po18",
-                        "normativa": "Decisión 584 (2004) Art 11 literal d). Decreto Ejecutivo 256 Capítulo II Art. 56",
-                        "pregunta": "¿Cuenta con registro de entrega de EPP y ropa de trabajo?",
-                        "requisitos": "Registro con: fecha, trabajador, cédula, detalle de EPP, firmas, devoluciones"
-                    },
-                    {
-                        "id": "po19",
-                        "normativa": "Decisión 584 (2004) Art 11. Decreto Ejecutivo 255 (2024) Art. 56.",
-                        "pregunta": "¿Se evidencia correcta utilización de EPP?",
-                        "requisitos": "Verificación in situ del uso adecuado"
-                    },
-                    {
-                        "id": "po20",
-                        "normativa": "Acuerdo Ministerial 032 (2017) Art. G. Acuerdo Ministerial 398 VIII-SIDA (2006), Acuerdo Ministerial 244. (2021)",
-                        "pregunta": "¿Se ha implementado programa de prevención de riesgo psicosocial?",
-                        "requisitos": "Programa con al menos 12 actividades implementadas"
-                    },
-                    {
-                        "id": "po21",
-                        "normativa": "Acuerdo Ministerial 032 (2017) Art. 9.",
-                        "pregunta": "¿Se ha implementado programa de prevención de consumo de alcohol, tabaco y drogas?",
-                        "requisitos": "Programa con actividades documentadas"
-                    },
-                    {
-                        "id": "po22",
-                        "normativa": "Acuerdo Interministerial 038 (2019).",
-                        "pregunta": "¿Se ha registrado el programa de prevención de consumo en el SUT?",
-                        "requisitos": "Captura de pantalla del registro en SUT"
-                    }
-                ]
-            },
-           "servicios_permanentes": {
-                "title": "Servicios Permanentes ",
-                    "questions": [
-                    {
-                        "id": "sp1",
-                        "normativa": "Código de Trabajo (2005) Art. 430",
-                        "pregunta": "¿Cuenta con botiquín de emergencia para primeros auxilios?",
-                        "requisitos": "Botiquín completo, accesible y con productos vigentes"
-                    },
-                    {
-                        "id": "sp2",
-                        "normativa": "Código de Trabajo (2005) Art. 42.",
-                        "pregunta": "¿El comedor cuenta con adecuada salubridad y ambientación?",
-                        "requisitos": "Limpieza, ventilación, mobiliario en buen estado"
-                    },
-                    {
-                        "id": "sp3",
-                        "normativa": "Acuerdo Ministerial 196 (2024), Anexo 3",
-                        "pregunta": "¿Aplica para centros con 50+ trabajadores a 2km de población?",
-                        "requisitos": "Solo si cumple las condiciones de distancia y número de trabajadores"
-                    },
-                    {
-                        "id": "sp4",
-                        "normativa": "Acuerdo Ministerial 196 (2024), Anexo 3",
-                        "pregunta": "¿En caso de existir cocina, cuenta con salubridad adecuada?",
-                        "requisitos": "Limpieza, almacenamiento adecuado de alimentos"
-                    },
-                    {
-                        "id": "sp5",
-                        "normativa": "Acuerdo Ministerial 196 (2024), Anexo 3",
-                        "pregunta": "¿Se dispone de abastecimiento de agua para consumo humano?",
-                        "requisitos": "Agua potable disponible para los trabajadores"
-                    },
-                    {
-                        "id": "sp6",
-                        "normativa": "Acuerdo Ministerial 196 (2024), Anexo 3",
-                        "pregunta": "¿Cuenta con servicios higiénicos en buenas condiciones?",
-                        "requisitos": "Limpios, funcionando, separados por sexo"
-                    },
-                    {
-                        "id": "sp7",
-                        "normativa": "Acuerdo Ministerial 196 (2024), Anexo 3",
-                        "pregunta": "¿Cuenta con duchas en buenas condiciones?",
-                        "requisitos": "Funcionando, limpias, con agua"
-                    },
-                    {
-                        "id": "sp8",
-                        "normativa": "Acuerdo Ministerial 196 (2024), Anexo 3",
-                        "pregunta": "¿Cuenta con lavabos en buenas condiciones y con útiles?",
-                        "requisitos": "Lavabos funcionando con jabón y toallas"
-                    },
-                    {
-                        "id": "sp9",
-                        "normativa": "Acuerdo Ministerial 196 (2024), Anexo 3",
-                        "pregunta": "¿Se dispone de vestuarios separados por sexo?",
-                        "requisitos": "Vestuarios limpios y en buen estado"
-                    },
-                    {
-                        "id": "sp10",
-                        "normativa": "Acuerdo Ministerial 196 (2024), Anexo 3",
-                        "pregunta": "¿Cuenta campamentos en buenas condiciones?",
-                        "requisitos": "Con luz, ventilación, agua, servicios higiénicos, comedores"
-                    }
-                ]
-            } 
-        }
-
-        with st.form("formulario_verificacion"):
-             # Iterar por cada sección
-            for seccion, datos_seccion in PREGUNTAS_SST.items():
-                st.markdown(f"## 🏛️ {seccion}")
-                
-                with st.expander(f"### 📌 {datos_seccion['title']}", expanded=False):
-                    # Mostrar cada pregunta en formato de tabla
-                    st.markdown("""
-                    <table class="verification-table">
-                        <thead>
-                            <tr>
-                                <th>N°</th>
-                                <th>CUMPLIMIENTO LEGAL / MEDIOS DE VERIFICACIÓN</th>
-                                <th>VERIFICACIÓN</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                    """, unsafe_allow_html=True)
-                    
-                    for pregunta in datos_seccion['questions']:
-                        st.markdown(f"""
-                        <tr>
-                            <td>{pregunta['id']}</td>
-                            <td>
-                                <div class='gestion-text'>{datos_seccion['title']}</div>
-                                <div class='pregunta-header'>{pregunta['pregunta']}</div>
-                                <div class='normativa-text'>Normativa: {pregunta['normativa']}</div>
-                            </td>
-                            <td>
-                        """, unsafe_allow_html=True)
-
-                        # Opción única de selección (corregida)
-                        opcion = st.radio(
-                            "Seleccione:",
-                            ["✅ Cumple", "❌ No cumple", "➖ No aplica"],
-                            key=f"opcion_{pregunta['id']}",
-                            horizontal=True,
-                            index=None
-                        )
-                        
-                        obs = st.text_input(
-                            "Observaciones",
-                            key=f"obs_{pregunta['id']}",
-                            placeholder="Opcional"
-                        )
-                        
-                        st.markdown("""
-                            </td>
-                        </tr>
-                        """, unsafe_allow_html=True)
-                    
-                    st.markdown("""
-                        </tbody>
-                    </table>
-                    """, unsafe_allow_html=True)
-
-            # Botón de envío
-            submitted = st.form_submit_button("💾 Guardar Formulario Completo", type="primary")
-            
-            if submitted:
-                # Procesar respuestas
-                preguntas_respuestas = []
-                for seccion, datos_seccion in PREGUNTAS_SST.items():
-                    for pregunta in datos_seccion['questions']:
-                        respuesta = st.session_state.get(f"opcion_{pregunta['id']}", "No seleccionado")
-                        
-                        preguntas_respuestas.append({
-                            "id": int(''.join(filter(str.isdigit, pregunta["id"]))),
-                            "seccion": seccion,
-                            "categoria": datos_seccion['title'],
-                            "pregunta": pregunta["pregunta"],
-                            "normativa": pregunta["normativa"],
-                            "respuesta": respuesta,
-                            "observaciones": st.session_state.get(f"obs_{pregunta['id']}", "")
-                        })
-                
-                # Crear objeto formulario
-                formulario = {
-                    "empresa_ruc": empresa["ruc"],
-                    "inspector_cedula": st.session_state.user_info["cedula"],
-                    "preguntas": preguntas_respuestas
-                }
-
-                try:
-                    response = requests.post(
-                        f"{BACKEND_URL}/formularios/",
-                        json=formulario,
-                        headers={"Authorization": f"Bearer {st.session_state.token}"}
-                    )
-                    if response.status_code == 200:
-                        st.success("✅ Formulario guardado exitosamente!")
-                        time.sleep(2)
-                        st.session_state.current_page = "reportes"
-                        st.rerun()
-                    else:
-                        st.error(f"Error al guardar formulario: {response.text}")
-                except requests.exceptions.RequestException:
-                    st.error("Error al conectar con el servidor")
-
-def generate_pdf_report(empresa, estadisticas, preguntas, observaciones_generales):
-    """Genera un PDF del reporte con encabezado y firma"""
-    
-    pdf = FPDF()
-    pdf.add_page()
-    pdf.set_auto_page_break(auto=True, margin=15)
-    
-    # Configurar fuente compatible (solución sin necesidad de fuente externa)
-    pdf.set_font("Arial", size=12)
-    
-    # Función para limpiar texto de caracteres especiales
-    def clean_text(text):
-        if text is None:
-            return ""
-        if not isinstance(text, str):
-            text = str(text)
-        # Reemplazo de caracteres especiales
-        replacements = {
-            'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
-            'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
-            'ñ': 'n', 'Ñ': 'N', 'ü': 'u', 'Ü': 'U',
-            '´': '', '`': '', '¨': '', '¿': '', '¡': ''
-        }
-        for orig, repl in replacements.items():
-            text = text.replace(orig, repl)
-        return text
-    
-    # Encabezado con logo
-    try:
-        pdf.image("https://via.placeholder.com/150x50?text=SESACO+Logo", x=10, y=8, w=40)
-    except:
-        pass
-    
-    pdf.set_font("Arial", 'B', 16)
-    pdf.cell(0, 10, clean_text("REPORTE DE VERIFICACION DE SEGURIDAD INDUSTRIAL"), ln=1, align='C')
-    pdf.set_font("Arial", size=12)
-    
-    # Información de la empresa
-    pdf.cell(0, 10, clean_text(f"Empresa: {empresa['razon_social']}"), ln=1)
-    pdf.cell(0, 10, clean_text(f"RUC: {empresa['ruc']}"), ln=1)
-    pdf.cell(0, 10, clean_text(f"Fecha de generacion: {datetime.now().strftime('%d/%m/%Y %H:%M')}"), ln=1)
-    pdf.ln(10)
-    
-    # Información general
-    pdf.set_font("Arial", 'B', 14)
-    pdf.cell(0, 10, clean_text("Resumen Ejecutivo"), ln=1)
-    pdf.set_font("Arial", size=12)
-    
-    cumplimiento = estadisticas['cumplimiento_promedio']
-    pdf.multi_cell(0, 8, clean_text(f"Cumplimiento general: {cumplimiento}%"))
-    
-    if cumplimiento >= 80:
-        evaluacion = "EXCELENTE"
-    elif cumplimiento >= 50:
-        evaluacion = "MODERADO"
-    else:
-        evaluacion = "BAJO"
-    
-    pdf.cell(0, 8, clean_text(f"Evaluacion: {evaluacion}"), ln=1)
-    
-    # Observaciones generales
-    if observaciones_generales:
-        pdf.ln(5)
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 8, clean_text("Observaciones Generales:"), ln=1)
-        pdf.set_font("Arial", size=11)
-        pdf.multi_cell(0, 8, clean_text(observaciones_generales))
-    
-    # Detalle por sección
-    pdf.add_page()
-    pdf.set_font("Arial", 'B', 14)
-    pdf.cell(0, 10, clean_text("Detalle por Area"), ln=1)
-    pdf.set_font("Arial", size=10)
-    
-    for seccion, datos in estadisticas["secciones"].items():
-        pdf.ln(5)
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 8, clean_text(f"Area: {seccion}"), ln=1)
-        pdf.set_font("Arial", size=10)
-        
-        total_aplicable = datos["total"] - datos["no_aplica"]
-        porcentaje = (datos["cumple"] / total_aplicable) * 100 if total_aplicable > 0 else 0
-        
-        pdf.cell(90, 8, clean_text(f"Porcentaje de cumplimiento: {porcentaje:.1f}%"))
-        pdf.cell(90, 8, clean_text(f"No conformidades: {datos['no_cumple']}"), ln=1)
-        
-        # Preguntas problemáticas
-        preguntas_no_cumplen = [p for p in preguntas if p["seccion"] == seccion and p["respuesta"] == "❌ No cumple"]
-        
-        if preguntas_no_cumplen:
-            pdf.set_font("Arial", 'B', 10)
-            pdf.cell(0, 8, clean_text("No conformidades identificadas:"), ln=1)
-            pdf.set_font("Arial", size=9)
-            
-            for p in preguntas_no_cumplen:
-                pdf.multi_cell(0, 6, clean_text(f"- {p['pregunta']}"))
-                pdf.multi_cell(0, 6, clean_text(f"  Normativa: {p['normativa']}"))
-                if p['observaciones']:
-                    pdf.multi_cell(0, 6, clean_text(f"  Observaciones: {p['observaciones']}"))
-                pdf.ln(2)
-    
-    # Firma y sello
-    pdf.add_page()
-    pdf.set_font("Arial", 'B', 12)
-    pdf.cell(0, 10, clean_text("Firma y Sello del Inspector"), ln=1)
-    pdf.ln(20)
-    
-    # Línea para firma
-    pdf.cell(80, 10, clean_text(f"Nombre: {st.session_state.user_info['nombre']}"), ln=1)
-    pdf.cell(80, 10, clean_text("Cedula: _________________________"), ln=1)
-    pdf.cell(80, 10, clean_text("Firma:  _________________________"), ln=1)
-    pdf.ln(20)
-    
-    # Pie de página
-    pdf.set_font("Arial", 'I', 8)
-    pdf.cell(0, 10, clean_text("Documento generado automaticamente por el sistema SESACO - Seguridad Industrial S.A."), 0, 0, 'C')
-    
-    return pdf.output(dest='S').encode('latin1')
-
-def reportes_page():
-    if st.button("← Regresar", key="back_reportes", type="secondary", use_container_width=True, 
-                help="Volver a la página anterior", on_click=go_back):
-        return
-    
-    st.title("📊 Reportes y Estadísticas")
-    st.markdown("---")
-    
-    if 'empresa_actual' in st.session_state and st.session_state.empresa_actual:
-        empresa = st.session_state.empresa_actual
-        
-        try:
-            # Obtener reporte de la empresa
-            response = requests.get(
-                f"{BACKEND_URL}/reportes/{empresa['ruc']}",
-                headers={"Authorization": f"Bearer {st.session_state.token}"}
-            )
-            
-            if response.status_code == 200:
-                reporte = response.json()
-                estadisticas = reporte["estadisticas"]
-                ultimo_formulario = reporte["ultimo_formulario"]
-                
-                st.subheader(f"Reporte para: {empresa['razon_social']}")
-                
-                # Manejo seguro de la fecha
-                fecha_verificacion = ultimo_formulario.get('fecha_verificacion', 'Fecha no disponible')
-                st.caption(f"Última verificación: {fecha_verificacion}")
-                
-                # Sección para observaciones generales
-                observaciones_generales = st.text_area("Observaciones Generales:", 
-                                                      placeholder="Ingrese observaciones generales para el informe...")
-                
-                # Métricas principales
-                with st.container():
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("📋 Total Verificaciones", 
-                                estadisticas["total_verificaciones"],
-                                help="Número total de verificaciones realizadas")
-                    with col2:
-                        st.metric("✅ Cumplimiento Promedio", 
-                                f"{estadisticas['cumplimiento_promedio']}%",
-                                help="Porcentaje promedio de cumplimiento")
-                    with col3:
-                        st.metric("📝 Preguntas Evaluadas", 
-                                sum(sec['total'] for sec in estadisticas['secciones'].values()),
-                                help="Total de preguntas evaluadas en todas las secciones")
-                # Gráfico general de cumplimiento
-                st.markdown("### 📈 Distribución General de Cumplimiento")
-                try:
-                    # Calcular totales
-                    total_cumple = sum(s['cumple'] for s in estadisticas['secciones'].values())
-                    total_no_cumple = sum(s['no_cumple'] for s in estadisticas['secciones'].values())
-                    total_no_aplica = sum(s['no_aplica'] for s in estadisticas['secciones'].values())
-                    
-                    # Crear gráfico de pastel
-                    fig_pie, ax_pie = plt.subplots(figsize=(8, 6))
-                    sizes = [total_cumple, total_no_cumple, total_no_aplica]
-                    labels = ['Cumple', 'No Cumple', 'No Aplica']
-                    colors = ['#4CAF50', '#F44336', '#FFC107']
-                    
-                    wedges, texts, autotexts = ax_pie.pie(
-                        sizes, 
-                        labels=labels, 
-                        colors=colors, 
-                        autopct='%1.1f%%',
-                        startangle=90,
-                        explode=(0.05, 0, 0),
-                        shadow=True,
-                        textprops={'fontsize': 12}
-                    )
-                    
-                    plt.setp(autotexts, size=12, weight="bold")
-                    ax_pie.axis('equal')
-                    ax_pie.set_title('Distribución de Cumplimiento', pad=20, fontweight='bold')
-                    
-                    st.pyplot(fig_pie)
-                    
-                    # Leyenda mejorada
-                    st.markdown("""
-                    <div style="
-                        background-color: #f8f9fa;
-                        padding: 12px;
-                        border-radius: 8px;
-                        margin: 15px 0;
-                        border-left: 4px solid #2E7D32;
-                    ">
-                        <strong style="color: #2E7D32">📌 Leyenda:</strong><br>
-                        <span style="color: #4CAF50">● Cumple:</span> Preguntas que cumplen con todos los requisitos<br>
-                        <span style="color: #F44336">● No Cumple:</span> Preguntas con no conformidades detectadas<br>
-                        <span style="color: #FFC107">● No Aplica:</span> Preguntas no relevantes para este centro de trabajo
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                except Exception as e:
-                    st.error(f"⚠️ No se pudo generar el gráfico: {str(e)}")
-
-                # Gráfico de barras por sección
-                st.markdown("### 📊 Cumplimiento por Área")
-                df_secciones = pd.DataFrame([
-                    {
-                        "Sección": seccion,
-                        "Cumplimiento (%)": (datos["cumple"] / (datos["total"] - datos["no_aplica"])) * 100 
-                                          if (datos["total"] - datos["no_aplica"]) > 0 else 0,
-                        "Cumple": datos["cumple"],
-                        "No Cumple": datos["no_cumple"],
-                        "No Aplica": datos["no_aplica"],
-                        "Total": datos["total"]
-                    }
-                    for seccion, datos in estadisticas["secciones"].items()
-                ])
-                
-                # Ordenar por cumplimiento
-                df_secciones = df_secciones.sort_values("Cumplimiento (%)", ascending=False)
-                
-                # Gráfico de barras
-                fig_bar, ax_bar = plt.subplots(figsize=(10, 6))
-                bars = ax_bar.barh(
-                    df_secciones["Sección"], 
-                    df_secciones["Cumplimiento (%)"],
-                    color=['#4CAF50' if x > 70 else '#FFC107' if x > 40 else '#F44336' for x in df_secciones["Cumplimiento (%)"]]
-                )
-                
-                # Añadir etiquetas a las barras
-                ax_bar.bar_label(bars, fmt='%.1f%%', padding=3, fontsize=10)
-                ax_bar.set_xlim(0, 100)
-                ax_bar.set_xlabel('Porcentaje de Cumplimiento')
-                ax_bar.set_title('Cumplimiento por Área de Verificación', pad=20, fontweight='bold')
-                ax_bar.grid(axis='x', linestyle='--', alpha=0.7)
-                
-                st.pyplot(fig_bar)
-
-                # Detalle por sección con gráficos individuales
-                st.markdown("### 📑 Detalle por Sección")
-                
-                for seccion, datos in estadisticas["secciones"].items():
-                    with st.expander(f"🔍 {seccion} - {datos['cumple']}/{datos['total'] - datos['no_aplica']} cumplen", expanded=False):
-                        # Calcula porcentaje de cumplimiento (excluyendo no aplica)
-                        total_aplicable = datos["total"] - datos["no_aplica"]
-                        porcentaje = (datos["cumple"] / total_aplicable) * 100 if total_aplicable > 0 else 0
-                        
-                        # Columnas para métricas y gráfico
-                        col_metrics, col_chart = st.columns([1, 2])
-                        
-                        with col_metrics:
-                            st.metric("📈 Porcentaje de Cumplimiento", f"{porcentaje:.1f}%")
-                            st.metric("✅ Cumple", datos["cumple"])
-                            st.metric("❌ No Cumple", datos["no_cumple"])
-                            st.metric("➖ No Aplica", datos["no_aplica"])
-                        
-                        with col_chart:
-                            # Gráfico de pastel por sección
-                            fig_sec, ax_sec = plt.subplots(figsize=(6, 6))
-                            sizes_sec = [datos["cumple"], datos["no_cumple"], datos["no_aplica"]]
-                            labels_sec = ['Cumple', 'No Cumple', 'No Aplica']
-                            colors_sec = ['#4CAF50', '#F44336', '#FFC107']
-                            
-                            wedges_sec = ax_sec.pie(
-                                sizes_sec, 
-                                labels=labels_sec, 
-                                colors=colors_sec, 
-                                autopct='%1.1f%%',
-                                startangle=90,
-                                textprops={'fontsize': 10}
-                            )
-                            
-                            ax_sec.set_title(f'Distribución en {seccion}', fontsize=12)
-                            st.pyplot(fig_sec)
-                        
-                        # Mostrar preguntas problemáticas con más detalle
-                        preguntas_no_cumplen = [
-                            p for p in ultimo_formulario["preguntas"] 
-                            if p["seccion"] == seccion and p["respuesta"] == "❌ No cumple"
-                        ]
-                        
-                        if preguntas_no_cumplen:
-                            st.warning(f"🚨 {len(preguntas_no_cumplen)} no conformidades encontradas en esta sección:")
-                            
-                            for idx, p in enumerate(preguntas_no_cumplen, 1):
-                                with st.container():
-                                    st.markdown(f"""
-                                    <div style='
-                                        background-color: #fff3e0;
-                                        border-radius: 8px;
-                                        padding: 1rem;
-                                        margin-bottom: 1rem;
-                                        border-left: 4px solid #FB8C00;
-                                    '>
-                                        <div style='font-weight: 600; color: #E65100;'>
-                                            No conformidad {idx}: {p['pregunta']}
-                                        </div>
-                                        <div style='font-size: 0.85rem; color: #666; font-style: italic; margin-top: 0.5rem;'>
-                                            <strong>Normativa:</strong> {p['normativa']}
-                                        </div>
-                                        <div style='margin-top: 0.5rem; font-size: 0.9rem;'>
-                                            <strong>Categoría:</strong> {p['categoria']}
-                                        </div>
-                                        {f"<div style='margin-top: 0.5rem; font-size: 0.9rem;'>📝 <strong>Observaciones:</strong> {p['observaciones']}</div>" if p['observaciones'] else ""}
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                        else:
-                            st.success("🎉 Todas las preguntas aplicables en esta sección cumplen con la normativa")
-
-                # Sección de exportación a PDF
-                st.markdown("---")
-                st.subheader("📤 Exportar Reporte Completo")
-
-                # Opciones de exportación
-                export_col1, export_col2 = st.columns(2)
-
-                with export_col1:
-                    # Generar PDF
-                    if st.button("🖨️ Generar Reporte PDF", type="primary", use_container_width=True):
-                        with st.spinner("Generando reporte PDF..."):
-                            # Asegurar que las observaciones no sean None
-                            obs_generales = observaciones_generales or "Sin observaciones"
-                            
-                            # Generar el PDF
-                            pdf_bytes = generate_pdf_report(
-                                empresa,
-                                estadisticas,
-                                ultimo_formulario["preguntas"],
-                                obs_generales
-                            )
-                            # Crear enlace de descarga
-                            b64 = base64.b64encode(pdf_bytes).decode()
-                            href = f'<a href="data:application/octet-stream;base64,{b64}" download="reporte_{empresa["ruc"]}_{datetime.now().strftime("%Y%m%d")}.pdf">Descargar Reporte PDF</a>'
-                
-                            st.markdown(href, unsafe_allow_html=True)
-                            st.success("✅ Reporte PDF generado exitosamente")
-                            st.balloons() 
-                        
-                            
-                            
-                            # Crear enlace de descarga
-                            #b64 = base64.b64encode(pdf_bytes).decode()
-                            #href = f'<a href="data:application/octet-stream;base64,{b64}" download="reporte_{empresa["ruc"]}_{datetime.now().strftime("%Y%m%d")}.pdf">Descargar Reporte PDF</a>'
-                            
-                            #st.markdown(href, unsafe_allow_html=True)
-                            #st.success("✅ Reporte PDF generado exitosamente")
-                            #st.balloons()
-
-                with export_col2:
-                    # Exportar datos a Excel
-                    if st.button("📊 Exportar a Excel", use_container_width=True):
-                        with st.spinner("Preparando datos para Excel..."):
-                            # Crear DataFrame con los datos del reporte
-                            report_data = []
-                            
-                            for pregunta in ultimo_formulario["preguntas"]:
-                                report_data.append({
-                                    "Sección": pregunta["seccion"],
-                                    "Categoría": pregunta["categoria"],
-                                    "Pregunta": pregunta["pregunta"],
-                                    "Normativa": pregunta["normativa"],
-                                    "Resultado": pregunta["respuesta"],
-                                    "Observaciones": pregunta["observaciones"]
-                                })
-                            
-                            df_report = pd.DataFrame(report_data)
-                            
-                            # Crear archivo Excel en memoria
-                            output = BytesIO()
-                            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                                df_report.to_excel(writer, sheet_name='Reporte', index=False)
-                            
-                            excel_data = output.getvalue()
-                            b64 = base64.b64encode(excel_data).decode()
-                            href = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="reporte_{empresa["ruc"]}_{datetime.now().strftime("%Y%m%d")}.xlsx">Descargar Reporte Excel</a>'
-                            
-                            st.markdown(href, unsafe_allow_html=True)
-                            st.success("✅ Datos preparados para exportar a Excel")
-                
-                # Resumen ejecutivo
-                st.markdown("---")
-                st.subheader("📋 Resumen Ejecutivo")
-                
-                # Calcular resumen de cumplimiento
-                cumplimiento_total = estadisticas['cumplimiento_promedio']
-                total_no_conformidades = sum(sec['no_cumple'] for sec in estadisticas['secciones'].values())
-                
-                if cumplimiento_total >= 80:
-                    st.success(f"🌟 Excelente cumplimiento general: {cumplimiento_total}%")
-                    st.markdown("""
-                    La empresa muestra un alto nivel de cumplimiento con las normativas de seguridad y salud en el trabajo. 
-                    Se recomienda mantener las buenas prácticas y realizar revisiones periódicas para asegurar la continuidad.
-                    """)
-                elif cumplimiento_total >= 50:
-                    st.warning(f"⚠️ Cumplimiento moderado: {cumplimiento_total}%")
-                    st.markdown(f"""
-                    La empresa tiene un nivel de cumplimiento aceptable pero con {total_no_conformidades} no conformidades identificadas. 
-                    Se recomienda:
-                    - Priorizar la corrección de las no conformidades críticas
-                    - Implementar un plan de mejora continua
-                    - Capacitar al personal en las áreas con menor cumplimiento
-                    """)
-                else:
-                    st.error(f"🚨 Bajo cumplimiento: {cumplimiento_total}%")
-                    st.markdown(f"""
-                    Se han identificado {total_no_conformidades} no conformidades que requieren atención inmediata. 
-                    Acciones recomendadas:
-                    - Elaborar un plan de acción correctivo urgente
-                    - Asignar recursos para abordar las deficiencias
-                    - Solicitar asesoría especializada si es necesario
-                    - Programar una re-inspección en el corto plazo
-                    """)
-                
-            else:
-                st.warning("⚠️ No hay suficientes datos para generar un reporte completo")
-                st.info("Complete al menos una verificación para generar reportes detallados")
-                
-        except requests.exceptions.RequestException as e:
-            st.error(f"🔴 Error de conexión: {str(e)}")
-            st.warning("Verifique su conexión a internet o intente nuevamente más tarde")
-            
-    else:
-        st.warning("👈 Seleccione una empresa primero en la página de Formulario de Verificación")
-        st.button("Ir a Formulario de Verificación", on_click=lambda: st.session_state.update({"current_page": "formulario_verificacion"}))
-
-# Menu principal
-if not st.session_state.logged_in:
-    login_page()
-else:
-    if st.session_state.current_page == "dashboard":
-        dashboard_page()
-    elif st.session_state.current_page == "gestion_empresas":
-        gestion_empresas_page()
-    elif st.session_state.current_page == "formulario_verificacion":
-        formulario_verificacion_page()
-    elif st.session_state.current_page == "reportes":
-        reportes_page()
-
+import streamlit as st
+import re
+import asyncio
+import httpx
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+from pathlib import Path
+import json
+import orjson
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+import base64
+from io import BytesIO
+import tempfile
+
+st.set_page_config(
+    page_title="Gestión de Seguridad y Salud en el Trabajo",
+    page_icon="🛡️",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# URL del backend
+BACKEND_URL = "http://localhost:8000"
+
+# Respuestas del formulario: por el cable y en los agregados viajan como
+# códigos enteros (comparar ints es una rama corta en C; las cadenas con
+# emoji son multi-codepoint); las etiquetas solo existen para la UI
+CUMPLE, NO_CUMPLE, NO_APLICA = 0, 1, 2
+OPCIONES_RESPUESTA = ("✅ Cumple", "❌ No cumple", "➖ No aplica")
+
+# Tabla de transliteración para los PDF (FPDF clásico solo maneja
+# latin-1): una sola pasada en C en lugar de ~20 str.replace por campo
+_CLEAN_TABLE = str.maketrans({
+    'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
+    'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
+    'ñ': 'n', 'Ñ': 'N', 'ü': 'u', 'Ü': 'U',
+    '´': None, '`': None, '¨': None, '¿': None, '¡': None,
+})
+
+@lru_cache(maxsize=4096)
+def _clean_text(text):
+    """Translitera texto a algo seguro para FPDF (latin-1).
+
+    Cachea por cadena: las normativas y los títulos se repiten entre
+    preguntas y entre reportes, así que la mayoría son hits.
+    """
+    if text is None:
+        return ""
+    return str(text).translate(_CLEAN_TABLE)
+
+# Envolturas estáticas de la tabla de verificación, construidas una vez
+_TABLE_OPEN = (
+    '<table class="verification-table">'
+    "<thead><tr><th>N°</th>"
+    "<th>CUMPLIMIENTO LEGAL / MEDIOS DE VERIFICACIÓN</th></tr></thead>"
+    "<tbody>"
+)
+_TABLE_CLOSE = "</tbody></table>"
+
+# Plantilla de fila de la tabla de verificación: el %-formato despacha
+# a una sola rutina en C por fila
+_ROW_FMT = (
+    "<tr>"
+    "<td>%s</td>"
+    "<td>"
+    "<div class='gestion-text'>%s</div>"
+    "<div class='pregunta-header'>%s</div>"
+    "<div class='normativa-text'>Normativa: %s</div>"
+    "</td>"
+    "</tr>"
+)
+
+# Separador de listas escritas a mano ("Ana, Juan ,  Eva")
+_COMMA_RE = re.compile(r"\s*,\s*")
+
+# Prosa del resumen ejecutivo: constantes de módulo para no reconstruir
+# los bloques multilínea en cada rerun; solo el número entra por .format
+RESUMEN_ALTO = """
+La empresa muestra un alto nivel de cumplimiento con las normativas de seguridad y salud en el trabajo.
+Se recomienda mantener las buenas prácticas y realizar revisiones periódicas para asegurar la continuidad.
+"""
+RESUMEN_MEDIO_TMPL = """
+La empresa tiene un nivel de cumplimiento aceptable pero con {n} no conformidades identificadas.
+Se recomienda:
+- Priorizar la corrección de las no conformidades críticas
+- Implementar un plan de mejora continua
+- Capacitar al personal en las áreas con menor cumplimiento
+"""
+RESUMEN_BAJO_TMPL = """
+Se han identificado {n} no conformidades que requieren atención inmediata.
+Acciones recomendadas:
+- Elaborar un plan de acción correctivo urgente
+- Asignar recursos para abordar las deficiencias
+- Solicitar asesoría especializada si es necesario
+- Programar una re-inspección en el corto plazo
+"""
+
+# Logo de relleno embebido (PNG verde 300x200): evita pedir la imagen a
+# via.placeholder.com en cada render del login y funciona sin internet
+_LOGO_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAASwAAADICAIAAADdvUsCAAABsElEQVR42u3TMQ0AAAzDsDIboPH/"
+    "C2PHLBlBpCQ7wCUJwIRgQsCEYELAhGBCwIRgQsCEYELAhGBCwIRgQsCEYELAhGBCwIRgQsCEYELA"
+    "hGBCwIRgQsCEYELAhGBCwIRgQsCEYELAhGBCwIRgQsCEYELAhGBCwIRgQsCEYELAhGBCwIRgQsCE"
+    "YELAhGBCwIRgQsCEYELAhGBCwIRgQsCEYEIwoQRgQjAhYEIwIWBCMCFgQjAhYEIwIWBCMCFgQjAh"
+    "YEIwIWBCMCFgQjAhYEIwIWBCMCFgQjAhYEIwIWBCMCFgQjAhYEIwIWBCMCFgQjAhYEIwIWBCMCFg"
+    "QjAhYEIwIWBCMCFgQjAhYEIwIWBCMCFgQjAhYEIwIWBCMCFgQjAhYEIwIZhQBTAhmBAwIZgQMCGY"
+    "EDAhmBAwIZgQMCGYEDAhmBAwIZgQMCGYEDAhmBAwIZgQMCGYEDAhmBAwIZgQMCGYEDAhmBAwIZgQ"
+    "MCGYEDAhmBAwIZgQMCGYEDAhmBAwIZgQMCGYEDAhmBAwIZgQMCGYEDAhmBAwIZgQMCGYEDAhmBAw"
+    "IZgQTAiYEEwImBB+KsIJrNY8WpBGAAAAAElFTkSuQmCC"
+)
+
+# Tope de espera (conexión, lectura) para toda llamada al backend: un
+# backend caído no debe dejar colgado el hilo de Streamlit
+DEFAULT_TIMEOUT = (3.05, 10)
+
+# Sesión HTTP compartida: mantiene las conexiones TCP vivas entre reruns
+# en lugar de abrir una conexión nueva por cada llamada al backend. El
+# módulo requests se importa arriba para que los except de las páginas
+# siempre tengan sus tipos de excepción; lo que se difiere a la primera
+# llamada real es construir la sesión con su pool y sus reintentos.
+_SESSION = None
+
+def _session():
+    global _SESSION
+    if _SESSION is None:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _SESSION = requests.Session()
+        _SESSION.headers.update({"Accept": "application/json"})
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            # Reintenta solo errores transitorios del backend, con backoff corto
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+        )
+        _SESSION.mount("http://", adapter)
+        _SESSION.mount("https://", adapter)
+    return _SESSION
+
+# Pool para despachar trabajo bloqueante (red, PDF) fuera del hilo que
+# ejecuta el script de Streamlit
+_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Preguntas del formulario de verificación SST, externalizadas a JSON
+_PREGUNTAS_SST_PATH = Path(__file__).with_name("preguntas_sst.json")
+
+# Sección en layout de tuplas paralelas: inmutable, compacto y sin un dict
+# por pregunta que reconstruir o recorrer en cada rerun
+Section = namedtuple(
+    "Section", "title ids num_ids normativas preguntas requisitos"
+)
+
+def _build_secciones(data):
+    """Convierte el JSON de preguntas (lista de dicts) a tuplas paralelas.
+
+    Las normativas y requisitos se repiten mucho entre preguntas (p. ej.
+    "Acuerdo Ministerial 196 (2024), Anexo 3"), así que se internan para
+    que cada texto exista una sola vez en memoria.
+    """
+    secciones = {}
+    for clave, sec in data.items():
+        qs = sec["questions"]
+        ids = tuple(q["id"] for q in qs)
+        secciones[clave] = Section(
+            title=sec["title"],
+            ids=ids,
+            num_ids=tuple(int(''.join(filter(str.isdigit, qid))) for qid in ids),
+            normativas=tuple(sys.intern(q["normativa"]) for q in qs),
+            preguntas=tuple(q["pregunta"] for q in qs),
+            requisitos=tuple(sys.intern(q["requisitos"]) for q in qs),
+        )
+    return secciones
+
+@st.cache_resource(show_spinner=False)
+def _load_preguntas():
+    """Carga las preguntas SST una sola vez por proceso.
+
+    Antes el dict vivía como literal dentro de la página del formulario y
+    se reconstruía (88 preguntas anidadas) en cada rerun de Streamlit.
+    """
+    return _build_secciones(json.loads(_PREGUNTAS_SST_PATH.read_text(encoding="utf-8")))
+
+def _ruc_valido(ruc):
+    """Valida el RUC localmente: 13 dígitos exactos.
+
+    Evita gastar un viaje al backend en entradas vacías o mal formadas.
+    """
+    return bool(ruc) and len(ruc) == 13 and ruc.isdigit()
+
+@st.cache_data(ttl=3300, show_spinner=False)
+def _do_login(cedula, password):
+    """Intercambia credenciales por un token y lo cachea ~55 minutos.
+
+    Lanza ValueError en credenciales inválidas para que el caché nunca
+    retenga un intento fallido (st.cache_data no memoriza excepciones).
+    """
+    response = _session().post(
+        f"{BACKEND_URL}/token",
+        data={"username": cedula, "password": password},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        timeout=DEFAULT_TIMEOUT,
+    )
+    if response.status_code != 200:
+        raise ValueError("credenciales inválidas")
+    return response.json()
+
+@st.cache_resource(ttl=300, show_spinner=False)
+def fetch_empresa(ruc, token):
+    """Busca una empresa por RUC en el backend, cacheando el resultado 5 minutos.
+
+    cache_resource devuelve el dict por referencia (sin la copia por
+    serialización de cache_data); es un objeto de solo lectura. El token
+    forma parte de la clave para no compartir resultados entre usuarios.
+    """
+    response = _session().get(
+        f"{BACKEND_URL}/empresas/{ruc}",
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=DEFAULT_TIMEOUT,
+    )
+    if response.status_code == 200:
+        return orjson.loads(response.content)
+    return None
+
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_verificacion_bootstrap(ruc, token):
+    """Trae empresa + catálogo de preguntas en un solo viaje al backend.
+
+    Sustituye el patrón de dos fases (buscar empresa y luego armar el
+    formulario) por una única respuesta agregada.
+    """
+    response = _session().get(
+        f"{BACKEND_URL}/empresas/{ruc}/verificacion-bootstrap",
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=DEFAULT_TIMEOUT,
+    )
+    if response.status_code == 200:
+        return orjson.loads(response.content)
+    return None
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_report(ruc, token):
+    """Trae el reporte agregado de una empresa, cacheado un minuto.
+
+    Cada tecla en el área de observaciones re-ejecuta la página; sin
+    caché eso era un GET al backend por pulsación.
+    """
+    response = _session().get(
+        f"{BACKEND_URL}/reportes/{ruc}",
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=DEFAULT_TIMEOUT,
+    )
+    if response.status_code == 200:
+        return orjson.loads(response.content)
+    return None
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _dashboard_stats(token):
+    """Trae las tres métricas del dashboard en paralelo (1 RTT en vez de 3).
+
+    Las tres llamadas son independientes, así que se solapan con
+    asyncio.gather sobre un AsyncClient en lugar de encadenarse.
+    """
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async def _fetch_all():
+        async with httpx.AsyncClient(base_url=BACKEND_URL, timeout=10.0) as client:
+            return await asyncio.gather(
+                client.get("/stats/empresas", headers=headers),
+                client.get("/stats/verificaciones", headers=headers),
+                client.get("/stats/cumplimiento", headers=headers),
+            )
+
+    respuestas = asyncio.run(_fetch_all())
+    # HTTPStatusError hereda de httpx.HTTPError: un no-2xx cae en el
+    # mismo except del dashboard en vez de reventar como KeyError
+    for r in respuestas:
+        r.raise_for_status()
+    empresas, verificaciones, cumplimiento = (r.json() for r in respuestas)
+    return empresas["total"], verificaciones["total"], cumplimiento["promedio"]
+
+def _auth_headers():
+    """Devuelve el header Authorization cacheado por sesión.
+
+    Se reconstruye solo cuando cambia el token, en lugar de un f-string
+    y un dict nuevos por cada llamada al backend.
+    """
+    tok = st.session_state.app.token
+    hdrs = st.session_state.get("_auth_hdrs")
+    if not hdrs or hdrs[1] != tok:
+        hdrs = ({"Authorization": f"Bearer {tok}"}, tok)
+        st.session_state._auth_hdrs = hdrs
+    return hdrs[0]
+
+def _empresa_actual():
+    """Resuelve la empresa activa a partir del RUC guardado en sesión.
+
+    En sesión vive solo el RUC; el dict completo llega por referencia
+    desde el caché de fetch_empresa, sin copias por rerun.
+    """
+    ruc = st.session_state.app.empresa_actual_ruc
+    if not ruc:
+        return None
+    try:
+        return fetch_empresa(ruc, st.session_state.app.token)
+    except requests.exceptions.RequestException:
+        return None
+
+# Estado de la sesión: un solo contenedor tipado en lugar de una clave
+# suelta (y un chequeo "not in") por cada campo
+@dataclass
+class AppState:
+    logged_in: bool = False
+    token: str | None = None
+    user_info: dict = field(default_factory=dict)
+    empresa_actual_ruc: str | None = None
+    preguntas_verificacion: dict = field(default_factory=dict)
+
+if "app" not in st.session_state:
+    st.session_state.app = AppState()
+
+# Colores principales según la imagen
+COLORES = {
+    "verde_bosque": "#006b3f",
+    "verde_hierba": "#6bbe44",
+    "gris_claro": "#f2f2f2",
+    "gris_oscuro": "#333333",
+    "negro": "#1a1a1a",
+    "blanco": "#ffffff"
+}
+
+# Estilos CSS personalizados con la paleta de colores proporcionada
+@st.cache_resource(show_spinner=False)
+def _css_blob():
+    """Interpola la paleta de colores en el CSS una sola vez por proceso."""
+    return f"""
+    <style>
+        :root {{
+            --primary: {COLORES["verde_bosque"]};
+            --secondary: {COLORES["verde_hierba"]};
+            --accent: {COLORES["verde_hierba"]};
+            --background: {COLORES["gris_claro"]};
+            --text: {COLORES["negro"]};
+            --header-text: {COLORES["blanco"]};
+        }}
+        
+        body {{
+            background-color: var(--background);
+            color: var(--text);
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        }}
+        
+        .stApp {{
+            background: {COLORES["gris_claro"]};
+        }}
+        
+        .header {{
+            background-color: {COLORES["verde_bosque"]};
+            color: {COLORES["blanco"]};
+            padding: 1rem;
+            margin-bottom: 2rem;
+            border-radius: 0 0 10px 10px;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        }}
+        
+        .header-title {{
+            color: {COLORES["blanco"]};
+            font-size: 1.8rem;
+            font-weight: 700;
+            margin-bottom: 0.5rem;
+        }}
+        
+        .header-subtitle {{
+            color: {COLORES["blanco"]};
+            font-size: 1.1rem;
+            opacity: 0.9;
+        }}
+        
+        .stButton>button {{
+            background-color: var(--primary);
+            color: white;
+            border-radius: 8px;
+            padding: 0.5rem 1rem;
+            border: none;
+            font-weight: 500;
+            transition: all 0.3s ease;
+        }}
+        
+        .stButton>button:hover {{
+            background-color: var(--accent);
+            color: white;
+            transform: translateY(-2px);
+            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+        }}
+        
+        .back-button {{
+            background-color: {COLORES["gris_claro"]} !important;
+            color: var(--primary) !important;
+            border: 1px solid var(--primary) !important;
+        }}
+        
+        .back-button:hover {{
+            background-color: #e8f5e9 !important;
+        }}
+        
+        .stTextInput>div>div>input, 
+        .stTextArea>div>div>textarea, 
+        .stSelectbox>div>div>select,
+        .stNumberInput>div>div>input {{
+            border-radius: 8px;
+            border: 1px solid {COLORES["verde_hierba"]};
+            padding: 0.5rem;
+            box-shadow: 0 1px 2px rgba(0,0,0,0.05);
+        }}
+        
+        .sidebar .sidebar-content {{
+            background-color: var(--primary);
+            color: white;
+            padding: 1rem;
+        }}
+        
+        h1, h2, h3, h4 {{
+            color: var(--primary);
+            margin-top: 0;
+        }}
+        
+        .custom-card {{
+            background-color: white;
+            border-radius: 10px;
+            padding: 1.5rem;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            margin-bottom: 1.5rem;
+            border-left: 4px solid var(--accent);
+        }}
+        
+        .pregunta-card {{
+            background-color: #f8f9fa;
+            border-left: 4px solid {COLORES["verde_hierba"]};
+            border-radius: 8px;
+            padding: 1rem;
+            margin-bottom: 1rem;
+            transition: all 0.3s ease;
+        }}
+        
+        .pregunta-card:hover {{
+            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+            transform: translateY(-2px);
+        }}
+        
+        .pregunta-header {{
+            color: {COLORES["verde_bosque"]};
+            font-weight: 600;
+            margin-bottom: 0.5rem;
+            font-size: 1.1rem;
+        }}
+        
+        .normativa-text {{
+            font-size: 0.85rem;
+            color: #666;
+            font-style: italic;
+            margin-bottom: 0.5rem;
+        }}
+        
+        .gestion-text {{
+            font-size: 0.9rem;
+            font-weight: 500;
+            color: {COLORES["verde_bosque"]};
+            margin-bottom: 0.5rem;
+        }}
+        
+        .observaciones-box {{
+            background-color: #fff8e1;
+            border-radius: 6px;
+            padding: 0.75rem;
+            margin-top: 0.75rem;
+            border-left: 3px solid #FFC107;
+        }}
+        
+        .success {{ color: {COLORES["verde_bosque"]}; }}
+        .warning {{ color: #FF8F00; }}
+        .error {{ color: #C62828; }}
+        
+        .stRadio>div>label {{
+            margin-right: 1rem;
+        }}
+        
+        .st-expander {{
+            background-color: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+        }}
+        
+        .st-expander .streamlit-expanderHeader {{
+            font-weight: 600;
+            color: var(--primary);
+        }}
+        
+        .metric-card {{
+            background-color: white;
+            border-radius: 10px;
+            padding: 1.5rem;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            margin-bottom: 1rem;
+            border-left: 4px solid var(--accent);
+        }}
+        
+        .verification-table {{
+            width: 100%;
+            border-collapse: collapse;
+            margin-bottom: 1rem;
+        }}
+        
+        .verification-table th {{
+            background-color: {COLORES["verde_bosque"]};
+            color: white;
+            padding: 0.5rem;
+            text-align: left;
+        }}
+        
+        .verification-table td {{
+            padding: 0.5rem;
+            border: 1px solid #ddd;
+        }}
+        
+        .verification-table tr:nth-child(even) {{
+            background-color: #f2f2f2;
+        }}
+        
+        .planes-section {{
+            background-color: {COLORES["gris_claro"]};
+            padding: 2rem;
+            border-radius: 10px;
+            margin-top: 2rem;
+            text-align: center;
+        }}
+        
+        .planes-title {{
+            color: {COLORES["verde_bosque"]};
+            font-size: 1.5rem;
+            margin-bottom: 1rem;
+            font-weight: 600;
+        }}
+        
+        .planes-subtitle {{
+            color: {COLORES["negro"]};
+            font-size: 1.1rem;
+            margin-bottom: 1.5rem;
+        }}
+        
+        .plan-card {{
+            background-color: white;
+            border-radius: 10px;
+            padding: 1.5rem;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+            margin: 1rem;
+            border-top: 4px solid {COLORES["verde_hierba"]};
+            transition: all 0.3s ease;
+        }}
+        
+        .plan-card:hover {{
+            transform: translateY(-5px);
+            box-shadow: 0 8px 15px rgba(0,0,0,0.1);
+        }}
+        
+        .plan-name {{
+            color: {COLORES["verde_bosque"]};
+            font-size: 1.2rem;
+            font-weight: 600;
+            margin-bottom: 0.5rem;
+        }}
+        
+        .plan-price {{
+            color: {COLORES["verde_hierba"]};
+            font-size: 1.5rem;
+            font-weight: 700;
+            margin-bottom: 1rem;
+        }}
+        
+        .plan-features {{
+            text-align: left;
+            margin-bottom: 1.5rem;
+        }}
+        
+        .feature-item {{
+            margin-bottom: 0.5rem;
+            display: flex;
+            align-items: center;
+        }}
+        
+        .feature-icon {{
+            color: {COLORES["verde_hierba"]};
+            margin-right: 0.5rem;
+        }}
+    </style>
+    """
+
+def load_css():
+    st.markdown(_css_blob(), unsafe_allow_html=True)
+
+load_css()
+
+# HTML estático del encabezado: se construye una sola vez al importar
+HEADER_HTML = """
+    <div class="header">
+        <div class="header-title">GESTIÓN DE SEGURIDAD Y SALUD EN EL TRABAJO</div>
+        <div class="header-subtitle">CONSULTA NUESTROS PLANES EMPRESARIALES Y PREMIUM</div>
+        <div class="header-subtitle">PARA EMPRESAS PEQUEÑAS, MEDIANAS Y GRANDES CON TODO TIPO DE MESSOS.</div>
+    </div>
+    """
+
+def show_header():
+    st.markdown(HEADER_HTML, unsafe_allow_html=True)
+
+# Página de inicio de sesión
+def login_page():
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.image(base64.b64decode(_LOGO_B64), width=250)
+    
+    with col2:
+        st.title("SESACO - Seguridad Industrial S.A.")
+        st.markdown("---")
+        
+        with st.form("login_form"):
+            cedula = st.text_input("Cédula", placeholder="1722212253", key="cedula_input")
+            password = st.text_input("Contraseña", type="password", placeholder="1722212253", key="password_input")
+            submit_button = st.form_submit_button("Iniciar Sesión", type="primary")
+            
+            if submit_button:
+                try:
+                    data = _do_login(cedula, password)
+                    st.session_state.app.logged_in = True
+                    st.session_state.app.token = data["access_token"]
+                    st.session_state.app.user_info = {
+                        "nombre": data["nombre"],
+                        "cedula": cedula,
+                        "rol": data.get("rol", "inspector")
+                    }
+                    st.rerun()
+                except ValueError:
+                    st.error("Cédula o contraseña incorrecta")
+                except requests.exceptions.Timeout:
+                    st.error("El servidor no responde (timeout)")
+                except requests.exceptions.RequestException as e:
+                    st.error(f"Error al conectar con el servidor: {str(e)}")
+
+# Página principal
+def dashboard_page():
+    show_header()
+
+    st.sidebar.title("Menú Principal")
+    st.sidebar.markdown(f"""
+    **Usuario:** {st.session_state.app.user_info['nombre']}  
+    **Rol:** {st.session_state.app.user_info['rol'].capitalize()}
+    """)
+    
+    if st.sidebar.button("🔒 Cerrar Sesión", type="primary"):
+        st.session_state.app.logged_in = False
+        st.session_state.app.token = None
+        st.rerun()
+    
+    st.title(f"Bienvenido, {st.session_state.app.user_info['nombre']}")
+    st.markdown("---")
+    
+    st.markdown("""
+    ### Sistema Integral de Verificación de Seguridad Industrial
+    
+    **SESACO Seguridad Industrial S.A.** ofrece soluciones completas para la gestión y verificación 
+    del cumplimiento de normativas de seguridad en el ambiente laboral.
+    """)
+    
+    # Tarjeta de métricas
+    with st.container():
+        st.markdown("""
+        <div class='custom-card'>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        try:
+            total_empresas, total_verificaciones, cumplimiento = _dashboard_stats(
+                st.session_state.app.token
+            )
+            col1.metric("Empresas Registradas", total_empresas)
+            col2.metric("Verificaciones", total_verificaciones)
+            col3.metric("Cumplimiento Promedio", f"{cumplimiento}%")
+        except httpx.HTTPError:
+            # Backend no disponible: se muestran los valores de referencia
+            col1.metric("Empresas Registradas", "28", "+3 este mes")
+            col2.metric("Verificaciones", "156", "15% más que el mes pasado")
+            col3.metric("Cumplimiento Promedio", "82%", "5% mejor que el promedio")
+        
+        st.markdown("</div>", unsafe_allow_html=True)
+    
+    st.markdown("### Acciones Rápidas")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("🔍 Buscar Empresa", use_container_width=True):
+            st.switch_page(PAGE_GESTION)
+    
+    with col2:
+        if st.button("📝 Nuevo Formulario", use_container_width=True):
+            st.switch_page(PAGE_FORMULARIO)
+    
+    with col3:
+        if st.button("📊 Generar Reporte", use_container_width=True):
+            st.switch_page(PAGE_REPORTES)
+
+# Gestión de empresas
+def gestion_empresas_page():
+    if msg := st.session_state.pop("_flash", None):
+        st.toast(msg, icon="✅")
+
+    st.title("🏢 Gestión de Empresas")
+    st.markdown("---")
+    
+    tab1, tab2 = st.tabs(["🔍 Buscar Empresa", "➕ Registrar Nueva Empresa"])
+    
+    with tab1:
+        st.subheader("Buscar Empresa por RUC")
+        ruc = st.text_input("Ingrese el RUC de la empresa", key="buscar_ruc")
+        
+        if st.button("Buscar", key="buscar_empresa_btn"):
+            if not _ruc_valido(ruc):
+                st.warning("El RUC debe tener 13 dígitos")
+            else:
+                try:
+                    empresa = fetch_empresa(ruc, st.session_state.app.token)
+                    if empresa:
+                        st.session_state.app.empresa_actual_ruc = ruc
+                        st.success("Empresa encontrada")
+                    else:
+                        st.warning("No se encontró una empresa con ese RUC")
+                except requests.exceptions.Timeout:
+                    st.error("El servidor no responde (timeout)")
+                except requests.exceptions.RequestException:
+                    st.error("Error al conectar con el servidor")
+
+        if empresa := _empresa_actual():
+            display_empresa_info(empresa)
+    
+    with tab2:
+        st.subheader("Registrar Nueva Empresa")
+        with st.form("empresa_form", clear_on_submit=True):
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                inspeccion = st.text_input("Inspección")
+                fecha = st.date_input("Fecha")
+                re_inspeccion = st.text_input("Re-inspección", placeholder="Ej: L-V 01/01/2000")
+                fecha_inspeccion = st.date_input("Fecha de Re-inspección")
+                fecha_informacion = st.text_input("Fecha Máxima para remitir información", placeholder="Ej: L-V 01/01/2000")
+                tipo_empresa = st.selectbox("Tipo de Empresa", ["Privada", "Pública"])
+                empleador = st.text_input("Empleador")
+                razon_social = st.text_input("Razón Social*", help="Nombre legal de la empresa")
+                ruc = st.text_input("RUC*", help="Número de RUC de 13 dígitos")
+                telefono = st.text_input("Número de Teléfono")
+                correo = st.text_input("Correo Electrónico")
+                actividad_economica = st.text_input("Actividad Económica Principal")
+                
+            with col2:
+                tipo_centro = st.selectbox("Tipo de Centro de Trabajo*", ["Matriz", "Sucursal"])
+                direccion = st.text_area("Dirección del Centro de Trabajo*")
+                total_trabajadores = st.number_input("Total de Trabajadores/Servidores*", min_value=1, value=200)
+                num_trabajadores_centro = st.number_input("Número de Trabajadores/Servidores del Centro de Trabajo*", min_value=1, value=10)
+                consolidado_planilla = st.selectbox("Consolidado de Planilla IESS*", ["Sí", "No"])
+                
+                st.subheader("Estadísticas de Trabajadores", divider="green")
+                col3, col4 = st.columns(2)
+                with col3:
+                    hombres = st.number_input("Hombres", min_value=0, value=0)
+                    mujeres = st.number_input("Mujeres", min_value=0, value=0)
+                    embarazadas = st.number_input("Embarazadas", min_value=0, value=0)
+                    mujeres_en_lactancia = st.number_input("Mujeres en Lactancia", min_value=0, value=0)
+                    extranjeros = st.number_input("Extranjeros", min_value=0, value=0)
+                    adolescentes = st.number_input("Adolescentes", min_value=0, value=0)
+                
+                with col4:
+                    teletrabajadores = st.number_input("Teletrabajadores", min_value=0, value=0)
+                    niños = st.number_input("Menores de edad", min_value=0, value=0)
+                    adultos_mayores = st.number_input("Adultos Mayores", min_value=0, value=0)
+                
+                numeros_centros_abiertos = st.text_input("Número de Centros de Trabajo Abiertos")
+                horario_trabajo = st.text_input("Horario de Trabajo Principal", placeholder="Ej: L-V 08:00-17:00")
+                entrevistados_raw = st.text_area("Personas Entrevistadas (separar por comas)")
+                
+            if st.form_submit_button("Registrar Empresa", type="primary"):
+                if not all([ruc, razon_social, tipo_centro, direccion]):
+                    st.error("Por favor complete los campos obligatorios (*)")
+                elif not _ruc_valido(ruc):
+                    st.error("El RUC debe tener 13 dígitos")
+                else:
+                    estadisticas = {
+                        "hombres": hombres,
+                        "mujeres": mujeres,
+                        "embarazadas": embarazadas,
+                        "teletrabajadores": teletrabajadores,
+                        "niños": niños,
+                        "adultos_mayores": adultos_mayores,
+                        "mujeres_en_lactancia": mujeres_en_lactancia,
+                        "extranjeros": extranjeros,
+                        "adolescentes": adolescentes
+                    }
+                    
+                    empresa_data = {
+                        "inspeccion": inspeccion,
+                        "fecha": str(fecha) if fecha else None,
+                        "re_inspeccion": re_inspeccion,
+                        "fecha_inspeccion": str(fecha_inspeccion) if fecha_inspeccion else None,
+                        "fecha_informacion": fecha_informacion,
+                        "tipo": tipo_empresa,
+                        "empleador": empleador,
+                        "razon_social": razon_social,
+                        "ruc": ruc,
+                        "telefono": telefono,
+                        "correo": correo,
+                        "actividad_economica": actividad_economica,
+                        "tipo_centro": tipo_centro,
+                        "direccion": direccion,
+                        "total_trabajadores": total_trabajadores,
+                        "num_trabajadores_centro": num_trabajadores_centro,
+                        "consolidado_planilla": consolidado_planilla == "Sí",
+                        "estadisticas": estadisticas,
+                        "horario_trabajo": horario_trabajo,
+                        "entrevistados": [e for e in _COMMA_RE.split(entrevistados_raw.strip()) if e],
+                        "numeros_centros_abiertos": numeros_centros_abiertos
+                    }
+                    
+                    try:
+                        response = _session().post(
+                            f"{BACKEND_URL}/empresas/",
+                            json=empresa_data,
+                            headers=_auth_headers(),
+                            timeout=DEFAULT_TIMEOUT,
+                        )
+                        if response.status_code == 200:
+                            # Aviso diferido vía toast: nada de time.sleep()
+                            # bloqueando el hilo del servidor
+                            st.session_state._flash = "Empresa registrada exitosamente"
+                            st.session_state.app.empresa_actual_ruc = ruc
+                            # La empresa recién creada debe ser visible de
+                            # inmediato, sin esperar a que venza el TTL
+                            fetch_empresa.clear()
+                            st.rerun()
+                        else:
+                            st.error(f"Error al registrar empresa: {response.text}")
+                    except requests.exceptions.Timeout:
+                        st.error("El servidor no responde (timeout)")
+                    except requests.exceptions.RequestException:
+                        st.error("Error al conectar con el servidor")
+
+def display_empresa_info(empresa):
+    st.markdown(f"""
+    <div class='custom-card'>
+        <h3>📋 {empresa['razon_social']}</h3>
+        <p><small>RUC: {empresa['ruc']} | Registrada el: {empresa['fecha_registro'][:10]}</small></p>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(f"**Tipo:** {empresa['tipo']}")
+        st.markdown(f"**Empleador:** {empresa['empleador']}")
+        st.markdown(f"**Teléfono:** {empresa['telefono']}")
+        st.markdown(f"**Correo:** {empresa['correo']}")
+        st.markdown(f"**Actividad Económica:** {empresa['actividad_economica']}")
+        st.markdown(f"**Tipo de Centro:** {empresa['tipo_centro']}")
+    
+    with col2:
+        st.markdown(f"**Dirección:** {empresa['direccion']}")
+        st.markdown(f"**Total Trabajadores:** {empresa['total_trabajadores']}")
+        st.markdown(f"**Planilla IESS:** {'Sí' if empresa['consolidado_planilla'] else 'No'}")
+        st.markdown(f"**Horario:** {empresa['horario_trabajo']}")
+        st.markdown(f"**Entrevistados:** {', '.join(empresa['entrevistados'])}")
+    
+    st.markdown("---")
+    st.subheader("📊 Estadísticas de Trabajadores")
+    
+    estadisticas = empresa['estadisticas']
+    # st.bar_chart acepta dicts directamente; evita construir un DataFrame
+    # de 9 filas solo para graficar
+    st.bar_chart(
+        {"Grupo": list(estadisticas.keys()), "Cantidad": list(estadisticas.values())},
+        x="Grupo",
+        y="Cantidad",
+    )
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+
+def formulario_verificacion_page():
+    st.title("📋 Formulario de Verificación")
+    st.markdown("---")
+    
+    # Paso 1: Seleccionar empresa
+    st.subheader("1. Seleccione la empresa a verificar")
+    ruc = st.text_input("Ingrese el RUC de la empresa", key="form_ruc_input")
+    
+    if st.button("Cargar Empresa", key="cargar_empresa_btn"):
+        if not _ruc_valido(ruc):
+            st.warning("El RUC debe tener 13 dígitos")
+        elif (ruc == st.session_state.get("_last_loaded_ruc")
+                and st.session_state.app.empresa_actual_ruc == ruc):
+            # Doble clic sobre el mismo RUC: ya está en sesión, sin viaje nuevo
+            st.info("La empresa de ese RUC ya está cargada")
+        else:
+            try:
+                bootstrap = fetch_verificacion_bootstrap(ruc, st.session_state.app.token)
+                if bootstrap:
+                    st.session_state.app.empresa_actual_ruc = ruc
+                    st.session_state.app.preguntas_verificacion = _build_secciones(
+                        bootstrap["preguntas"]
+                    )
+                    st.session_state._last_loaded_ruc = ruc
+                    st.success(f"Empresa cargada: {bootstrap['empresa']['razon_social']}")
+                else:
+                    st.warning("No se encontró una empresa con ese RUC")
+            except requests.exceptions.Timeout:
+                st.error("El servidor no responde (timeout)")
+            except requests.exceptions.RequestException:
+                st.error("Error al conectar con el servidor")
+    
+    if empresa := _empresa_actual():
+        display_empresa_info(empresa)
+
+        # Paso 2: Cargar estructura del formulario
+        st.subheader("2. Complete el formulario de verificación")
+
+        # Estructura del formulario: la versión que trajo el bootstrap del
+        # backend, o el catálogo local como respaldo
+        PREGUNTAS_SST = st.session_state.app.preguntas_verificacion or _load_preguntas()
+
+        with st.form("formulario_verificacion"):
+             # Iterar por cada sección
+            for seccion, datos_seccion in PREGUNTAS_SST.items():
+                st.markdown(f"## 🏛️ {seccion}")
+                
+                with st.expander(f"### 📌 {datos_seccion.title}", expanded=False):
+                    # Toda la tabla de la sección viaja en un solo
+                    # st.markdown (un frame al frontend) en lugar de
+                    # varios fragmentos HTML por pregunta
+                    partes = [_TABLE_OPEN]
+                    for i, qid in enumerate(datos_seccion.ids):
+                        partes.append(_ROW_FMT % (
+                            qid,
+                            datos_seccion.title,
+                            datos_seccion.preguntas[i],
+                            datos_seccion.normativas[i],
+                        ))
+                    partes.append(_TABLE_CLOSE)
+                    st.markdown("".join(partes), unsafe_allow_html=True)
+
+                    # Los widgets sí deben ser llamadas reales, una por
+                    # pregunta, identificadas por su número
+                    for i, qid in enumerate(datos_seccion.ids):
+                        opcion = st.radio(
+                            f"Verificación {qid}:",
+                            OPCIONES_RESPUESTA,
+                            key=f"opcion_{qid}",
+                            horizontal=True,
+                            index=None
+                        )
+
+                        obs = st.text_input(
+                            f"Observaciones {qid}",
+                            key=f"obs_{qid}",
+                            placeholder="Opcional"
+                        )
+
+            # Botón de envío
+            submitted = st.form_submit_button("💾 Guardar Formulario Completo", type="primary")
+            
+            if submitted:
+                # Procesar respuestas
+                preguntas_respuestas = []
+                # Referencia local a session_state y claves por
+                # concatenación: evita una resolución de atributo y dos
+                # f-strings por pregunta
+                ss = st.session_state
+                for seccion, datos_seccion in PREGUNTAS_SST.items():
+                    for i, qid in enumerate(datos_seccion.ids):
+                        preguntas_respuestas.append({
+                            "id": datos_seccion.num_ids[i],
+                            "seccion": seccion,
+                            "categoria": datos_seccion.title,
+                            "pregunta": datos_seccion.preguntas[i],
+                            "normativa": datos_seccion.normativas[i],
+                            "respuesta": (
+                                OPCIONES_RESPUESTA.index(opcion)
+                                if (opcion := ss.get("opcion_" + qid)) is not None
+                                else None
+                            ),
+                            "observaciones": ss.get("obs_" + qid, "")
+                        })
+                
+                # Crear objeto formulario
+                formulario = {
+                    "empresa_ruc": empresa["ruc"],
+                    "inspector_cedula": st.session_state.app.user_info["cedula"],
+                    "preguntas": preguntas_respuestas
+                }
+
+                try:
+                    # Serializa con orjson (encoder en C, ~5x más rápido
+                    # que json.dumps) y manda los bytes directamente en
+                    # vez de dejar que requests pase por json.dumps
+                    payload = orjson.dumps(formulario)
+                    # El POST viaja por el pool: el hilo del script queda
+                    # libre para pintar el spinner durante el round-trip
+                    future = _POOL.submit(
+                        _session().post,
+                        f"{BACKEND_URL}/formularios/",
+                        data=payload,
+                        headers={"Content-Type": "application/json", **_auth_headers()},
+                        timeout=DEFAULT_TIMEOUT,
+                    )
+                    with st.spinner("Guardando formulario..."):
+                        response = future.result()
+                    if response.status_code == 200:
+                        # El reporte cacheado quedó obsoleto con el nuevo
+                        # formulario
+                        _fetch_report.clear()
+                        st.session_state._flash = "Formulario guardado exitosamente"
+                        st.switch_page(PAGE_REPORTES)
+                    else:
+                        st.error(f"Error al guardar formulario: {response.text}")
+                except requests.exceptions.Timeout:
+                    st.error("El servidor no responde (timeout)")
+                except requests.exceptions.RequestException:
+                    st.error("Error al conectar con el servidor")
+
+def generate_pdf_report(empresa, estadisticas, preguntas, observaciones_generales,
+                        inspector_nombre):
+    """Genera un PDF del reporte con encabezado y firma.
+
+    Reentrante a propósito (no toca session_state ni globales): puede
+    correr en un hilo del pool sin pelearse con el hilo del script.
+    """
+    # Import diferido: fpdf solo se paga cuando alguien genera un PDF
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    
+    # Configurar fuente compatible (solución sin necesidad de fuente externa)
+    pdf.set_font("Arial", size=12)
+    
+    # Limpieza de texto con caché compartido entre reportes
+    clean_text = _clean_text
+    
+    pdf.set_font("Arial", 'B', 16)
+    pdf.cell(0, 10, clean_text("REPORTE DE VERIFICACION DE SEGURIDAD INDUSTRIAL"), ln=1, align='C')
+    pdf.set_font("Arial", size=12)
+    
+    # Información de la empresa
+    pdf.cell(0, 10, clean_text(f"Empresa: {empresa['razon_social']}"), ln=1)
+    pdf.cell(0, 10, clean_text(f"RUC: {empresa['ruc']}"), ln=1)
+    # La marca de tiempo se formatea una vez y no lleva acentos: no hace
+    # falta pasarla por clean_text
+    ahora = datetime.now().strftime('%d/%m/%Y %H:%M')
+    pdf.cell(0, 10, f"Fecha de generacion: {ahora}", ln=1)
+    pdf.ln(10)
+    
+    # Información general
+    pdf.set_font("Arial", 'B', 14)
+    pdf.cell(0, 10, clean_text("Resumen Ejecutivo"), ln=1)
+    pdf.set_font("Arial", size=12)
+    
+    cumplimiento = estadisticas['cumplimiento_promedio']
+    pdf.multi_cell(0, 8, clean_text(f"Cumplimiento general: {cumplimiento}%"))
+    
+    if cumplimiento >= 80:
+        evaluacion = "EXCELENTE"
+    elif cumplimiento >= 50:
+        evaluacion = "MODERADO"
+    else:
+        evaluacion = "BAJO"
+    
+    pdf.cell(0, 8, clean_text(f"Evaluacion: {evaluacion}"), ln=1)
+    
+    # Observaciones generales
+    if observaciones_generales:
+        pdf.ln(5)
+        pdf.set_font("Arial", 'B', 12)
+        pdf.cell(0, 8, clean_text("Observaciones Generales:"), ln=1)
+        pdf.set_font("Arial", size=11)
+        pdf.multi_cell(0, 8, clean_text(observaciones_generales))
+    
+    # Detalle por sección
+    pdf.add_page()
+    pdf.set_font("Arial", 'B', 14)
+    pdf.cell(0, 10, clean_text("Detalle por Area"), ln=1)
+    pdf.set_font("Arial", size=10)
+    
+    # Mismo agrupamiento O(N) que en la página de reportes
+    no_cumple_por_seccion = defaultdict(list)
+    for p in preguntas:
+        if p["respuesta"] == NO_CUMPLE:
+            no_cumple_por_seccion[p["seccion"]].append(p)
+
+    # Lista de render precomputada (estilo, tamaño, alto, texto): todo el
+    # texto se arma primero y FPDF se alimenta en un bucle plano abajo
+    ops = []
+    for seccion, datos in estadisticas["secciones"].items():
+        total_aplicable = datos["total"] - datos["no_aplica"]
+        porcentaje = (datos["cumple"] / total_aplicable) * 100 if total_aplicable > 0 else 0
+
+        ops.append(('B', 12, 8, clean_text(f"Area: {seccion}")))
+        ops.append(('', 10, 8, clean_text(
+            f"Porcentaje de cumplimiento: {porcentaje:.1f}%   "
+            f"No conformidades: {datos['no_cumple']}"
+        )))
+
+        # Preguntas problemáticas
+        preguntas_no_cumplen = no_cumple_por_seccion.get(seccion, ())
+
+        if preguntas_no_cumplen:
+            ops.append(('B', 10, 8, clean_text("No conformidades identificadas:")))
+            # Un solo multi_cell por sección: FPDF paga el layout por
+            # llamada, no por línea
+            bloques = []
+            for p in preguntas_no_cumplen:
+                bloque = f"- {p['pregunta']}\n  Normativa: {p['normativa']}"
+                if p['observaciones']:
+                    bloque += f"\n  Observaciones: {p['observaciones']}"
+                bloques.append(clean_text(bloque))
+            ops.append(('', 9, 6, "\n".join(bloques)))
+
+    # set_font re-parsea métricas en cada llamada: solo se emite cuando
+    # la fuente realmente cambia entre operaciones consecutivas
+    fuente_actual = None
+    for estilo, tam, alto, texto in ops:
+        if (estilo, tam) != fuente_actual:
+            pdf.set_font("Arial", estilo, tam)
+            fuente_actual = (estilo, tam)
+        pdf.multi_cell(0, alto, texto)
+    
+    # Firma y sello
+    pdf.add_page()
+    pdf.set_font("Arial", 'B', 12)
+    pdf.cell(0, 10, clean_text("Firma y Sello del Inspector"), ln=1)
+    pdf.ln(20)
+    
+    # Línea para firma
+    pdf.cell(80, 10, clean_text(f"Nombre: {inspector_nombre}"), ln=1)
+    pdf.cell(80, 10, clean_text("Cedula: _________________________"), ln=1)
+    pdf.cell(80, 10, clean_text("Firma:  _________________________"), ln=1)
+    pdf.ln(20)
+    
+    # Pie de página
+    pdf.set_font("Arial", 'I', 8)
+    pdf.cell(0, 10, clean_text("Documento generado automaticamente por el sistema SESACO - Seguridad Industrial S.A."), 0, 0, 'C')
+    
+    # Escribe el documento a un archivo temporal en vez de materializarlo
+    # como str y re-codificarlo a bytes en memoria
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tf:
+        pdf_path = tf.name
+    pdf.output(pdf_path)
+    return pdf_path
+
+@st.cache_data(show_spinner=False)
+def _build_pdf_bytes(empresa_json, estadisticas_json, preguntas_json,
+                     observaciones_generales, inspector_nombre):
+    """Bytes del PDF, memoizados por el contenido serializado del reporte.
+
+    Los argumentos llegan como bytes de orjson (hashables para la clave
+    de caché); mientras el formulario no cambie, los clics repetidos de
+    descarga se sirven de memoria sin volver a armar el documento.
+    """
+    pdf_path = _POOL.submit(
+        generate_pdf_report,
+        orjson.loads(empresa_json),
+        orjson.loads(estadisticas_json),
+        orjson.loads(preguntas_json),
+        observaciones_generales,
+        inspector_nombre,
+    ).result()
+    ruta = Path(pdf_path)
+    try:
+        return ruta.read_bytes()
+    finally:
+        ruta.unlink(missing_ok=True)
+
+@st.cache_data(show_spinner=False)
+def _build_excel_bytes(preguntas_json):
+    """Bytes del Excel, memoizados por el contenido de las preguntas."""
+    import xlsxwriter
+
+    # Escritura directa con xlsxwriter: las columnas son fijas, así que
+    # no hace falta pasar por un DataFrame intermedio; constant_memory
+    # vuelca cada fila al salir en vez de retener la hoja completa en RAM
+    output = BytesIO()
+    wb = xlsxwriter.Workbook(output, {'constant_memory': True})
+    ws = wb.add_worksheet('Reporte')
+    ws.write_row(0, 0, (
+        "Sección", "Categoría", "Pregunta",
+        "Normativa", "Resultado", "Observaciones",
+    ))
+    for fila, pregunta in enumerate(orjson.loads(preguntas_json), start=1):
+        ws.write_row(fila, 0, (
+            pregunta["seccion"],
+            pregunta["categoria"],
+            pregunta["pregunta"],
+            pregunta["normativa"],
+            (
+                OPCIONES_RESPUESTA[r]
+                if (r := pregunta["respuesta"]) is not None
+                else "No seleccionado"
+            ),
+            pregunta["observaciones"],
+        ))
+    wb.close()
+    return output.getvalue()
+
+@st.cache_resource(show_spinner=False)
+def _pie_general(cumple, no_cumple, no_aplica):
+    """Pastel general de cumplimiento, memoizado por sus tres totales.
+
+    Armar una figura de matplotlib cuesta cientos de ms de Python puro;
+    mientras los datos no cambien, los reruns reutilizan el objeto.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(8, 6))
+    wedges, texts, autotexts = ax.pie(
+        [cumple, no_cumple, no_aplica],
+        labels=['Cumple', 'No Cumple', 'No Aplica'],
+        colors=['#4CAF50', '#F44336', '#FFC107'],
+        autopct='%1.1f%%',
+        startangle=90,
+        explode=(0.05, 0, 0),
+        shadow=True,
+        textprops={'fontsize': 12}
+    )
+    plt.setp(autotexts, size=12, weight="bold")
+    ax.axis('equal')
+    ax.set_title('Distribución de Cumplimiento', pad=20, fontweight='bold')
+    # Fuera del registro global de pyplot; el objeto sigue siendo usable
+    plt.close(fig)
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _bar_secciones(filas):
+    """Barras de cumplimiento por sección.
+
+    filas es una tupla ordenada de pares (sección, porcentaje): hashable,
+    así sirve directamente como clave del caché.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    nombres = [f[0] for f in filas]
+    porcentajes = [f[1] for f in filas]
+    bars = ax.barh(
+        nombres,
+        porcentajes,
+        color=['#4CAF50' if x > 70 else '#FFC107' if x > 40 else '#F44336' for x in porcentajes]
+    )
+    ax.bar_label(bars, fmt='%.1f%%', padding=3, fontsize=10)
+    ax.set_xlim(0, 100)
+    ax.set_xlabel('Porcentaje de Cumplimiento')
+    ax.set_title('Cumplimiento por Área de Verificación', pad=20, fontweight='bold')
+    ax.grid(axis='x', linestyle='--', alpha=0.7)
+    plt.close(fig)
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def _pie_seccion(seccion, cumple, no_cumple, no_aplica):
+    """Pastel de una sección, memoizado por sección y sus conteos."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(6, 6))
+    ax.pie(
+        [cumple, no_cumple, no_aplica],
+        labels=['Cumple', 'No Cumple', 'No Aplica'],
+        colors=['#4CAF50', '#F44336', '#FFC107'],
+        autopct='%1.1f%%',
+        startangle=90,
+        textprops={'fontsize': 10}
+    )
+    ax.set_title(f'Distribución en {seccion}', fontsize=12)
+    plt.close(fig)
+    return fig
+
+@st.fragment
+def _export_section(empresa, estadisticas, ultimo_formulario, observaciones_generales):
+    """Botones de exportación aislados en un fragmento.
+
+    Un clic en exportar re-ejecuta solo esta función, no la página de
+    reportes completa con sus gráficos; el botón de descarga que aparece
+    ya confirma el resultado, sin mensajes extra por protobuf.
+    """
+    # Fecha del nombre de archivo calculada una sola vez para ambos botones
+    hoy_str = datetime.now().strftime('%Y%m%d')
+    export_col1, export_col2 = st.columns(2)
+
+    with export_col1:
+        # Generar PDF
+        if st.button("🖨️ Generar Reporte PDF", type="primary", use_container_width=True):
+            with st.spinner("Generando reporte PDF..."):
+                # Asegurar que las observaciones no sean None
+                obs_generales = observaciones_generales or "Sin observaciones"
+
+                # Bytes cacheados por contenido: volver a pedir el mismo
+                # reporte no regenera el documento
+                pdf_bytes = _build_pdf_bytes(
+                    orjson.dumps(empresa),
+                    orjson.dumps(estadisticas),
+                    orjson.dumps(ultimo_formulario["preguntas"]),
+                    obs_generales,
+                    st.session_state.app.user_info['nombre'],
+                )
+                st.download_button(
+                    "⬇️ Descargar Reporte PDF",
+                    data=pdf_bytes,
+                    file_name=f"reporte_{empresa['ruc']}_{hoy_str}.pdf",
+                    mime="application/pdf",
+                )
+
+    with export_col2:
+        # Exportar datos a Excel
+        if st.button("📊 Exportar a Excel", use_container_width=True):
+            with st.spinner("Preparando datos para Excel..."):
+                # Bytes cacheados por contenido de las preguntas
+                excel_data = _build_excel_bytes(
+                    orjson.dumps(ultimo_formulario["preguntas"])
+                )
+
+                # Descarga binaria directa: sin el rodeo por base64 ni el
+                # data-URI incrustado en el DOM
+                st.download_button(
+                    "⬇️ Descargar Reporte Excel",
+                    data=excel_data,
+                    file_name=f"reporte_{empresa['ruc']}_{hoy_str}.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                )
+
+def reportes_page():
+    if msg := st.session_state.pop("_flash", None):
+        st.toast(msg, icon="✅")
+
+    st.title("📊 Reportes y Estadísticas")
+    st.markdown("---")
+
+    if empresa := _empresa_actual():
+        try:
+            # Obtener reporte de la empresa (cacheado 60 s)
+            reporte = _fetch_report(empresa['ruc'], st.session_state.app.token)
+
+            if reporte:
+                estadisticas = reporte["estadisticas"]
+                ultimo_formulario = reporte["ultimo_formulario"]
+
+                # Una sola pasada sobre las secciones: métricas, pastel,
+                # barras y expanders reutilizan estos arreglos paralelos
+                # en lugar de volver a recorrer el dict cada uno
+                sec_nombres = []
+                sec_cumple = []
+                sec_no_cumple = []
+                sec_no_aplica = []
+                sec_total = []
+                for seccion, datos in estadisticas["secciones"].items():
+                    sec_nombres.append(seccion)
+                    sec_cumple.append(datos["cumple"])
+                    sec_no_cumple.append(datos["no_cumple"])
+                    sec_no_aplica.append(datos["no_aplica"])
+                    sec_total.append(datos["total"])
+                sec_aplicable = [t - na for t, na in zip(sec_total, sec_no_aplica)]
+                sec_pct = [100 * c / a if a else 0.0 for c, a in zip(sec_cumple, sec_aplicable)]
+                
+                st.subheader(f"Reporte para: {empresa['razon_social']}")
+                
+                # Manejo seguro de la fecha
+                fecha_verificacion = ultimo_formulario.get('fecha_verificacion', 'Fecha no disponible')
+                st.caption(f"Última verificación: {fecha_verificacion}")
+                
+                # Sección para observaciones generales
+                observaciones_generales = st.text_area("Observaciones Generales:", 
+                                                      placeholder="Ingrese observaciones generales para el informe...")
+                
+                # Métricas principales
+                with st.container():
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("📋 Total Verificaciones", 
+                                estadisticas["total_verificaciones"],
+                                help="Número total de verificaciones realizadas")
+                    with col2:
+                        st.metric("✅ Cumplimiento Promedio", 
+                                f"{estadisticas['cumplimiento_promedio']}%",
+                                help="Porcentaje promedio de cumplimiento")
+                    with col3:
+                        st.metric("📝 Preguntas Evaluadas", 
+                                sum(sec_total),
+                                help="Total de preguntas evaluadas en todas las secciones")
+                # Gráfico general de cumplimiento
+                st.markdown("### 📈 Distribución General de Cumplimiento")
+                try:
+                    # Calcular totales
+                    total_cumple = sum(sec_cumple)
+                    total_no_cumple = sum(sec_no_cumple)
+                    total_no_aplica = sum(sec_no_aplica)
+                    
+                    # Gráfico de pastel (figura cacheada por totales)
+                    st.pyplot(_pie_general(total_cumple, total_no_cumple, total_no_aplica))
+                    
+                    # Leyenda mejorada
+                    st.markdown("""
+                    <div style="
+                        background-color: #f8f9fa;
+                        padding: 12px;
+                        border-radius: 8px;
+                        margin: 15px 0;
+                        border-left: 4px solid #2E7D32;
+                    ">
+                        <strong style="color: #2E7D32">📌 Leyenda:</strong><br>
+                        <span style="color: #4CAF50">● Cumple:</span> Preguntas que cumplen con todos los requisitos<br>
+                        <span style="color: #F44336">● No Cumple:</span> Preguntas con no conformidades detectadas<br>
+                        <span style="color: #FFC107">● No Aplica:</span> Preguntas no relevantes para este centro de trabajo
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                except Exception as e:
+                    st.error(f"⚠️ No se pudo generar el gráfico: {str(e)}")
+
+                # Gráfico de barras por sección
+                st.markdown("### 📊 Cumplimiento por Área")
+                # Pares (sección, % cumplimiento) ordenados de mayor a
+                # menor: listas planas, sin armar un DataFrame solo para
+                # alimentar dos columnas del gráfico
+                filas = sorted(
+                    zip(sec_nombres, sec_pct),
+                    key=lambda fila: fila[1],
+                    reverse=True,
+                )
+
+                # Gráfico de barras (figura cacheada por filas ordenadas)
+                st.pyplot(_bar_secciones(tuple(filas)))
+
+                # Detalle por sección con gráficos individuales
+                st.markdown("### 📑 Detalle por Sección")
+
+                # No conformidades agrupadas por sección en una pasada
+                # O(N), en vez de filtrar la lista completa por sección
+                no_cumple_por_seccion = defaultdict(list)
+                for p in ultimo_formulario["preguntas"]:
+                    if p["respuesta"] == NO_CUMPLE:
+                        no_cumple_por_seccion[p["seccion"]].append(p)
+                
+                for j, seccion in enumerate(sec_nombres):
+                    with st.expander(f"🔍 {seccion} - {sec_cumple[j]}/{sec_aplicable[j]} cumplen", expanded=False):
+                        # Columnas para métricas y gráfico
+                        col_metrics, col_chart = st.columns([1, 2])
+                        
+                        with col_metrics:
+                            st.metric("📈 Porcentaje de Cumplimiento", f"{sec_pct[j]:.1f}%")
+                            st.metric("✅ Cumple", sec_cumple[j])
+                            st.metric("❌ No Cumple", sec_no_cumple[j])
+                            st.metric("➖ No Aplica", sec_no_aplica[j])
+                        
+                        with col_chart:
+                            conteos = (sec_cumple[j], sec_no_cumple[j], sec_no_aplica[j])
+                            if sum(1 for v in conteos if v) <= 1:
+                                # Con una sola categoría el pastel es una
+                                # rueda sin cortes: no vale una figura
+                                k = max(range(3), key=conteos.__getitem__)
+                                st.info(f"{OPCIONES_RESPUESTA[k]}: {conteos[k]} pregunta(s)")
+                            else:
+                                # Gráfico de pastel por sección (cacheado)
+                                st.pyplot(_pie_seccion(seccion, *conteos))
+                        
+                        # Mostrar preguntas problemáticas con más detalle
+                        preguntas_no_cumplen = no_cumple_por_seccion.get(seccion, ())
+                        
+                        if preguntas_no_cumplen:
+                            st.warning(f"🚨 {len(preguntas_no_cumplen)} no conformidades encontradas en esta sección:")
+                            
+                            for idx, p in enumerate(preguntas_no_cumplen, 1):
+                                with st.container():
+                                    st.markdown(f"""
+                                    <div style='
+                                        background-color: #fff3e0;
+                                        border-radius: 8px;
+                                        padding: 1rem;
+                                        margin-bottom: 1rem;
+                                        border-left: 4px solid #FB8C00;
+                                    '>
+                                        <div style='font-weight: 600; color: #E65100;'>
+                                            No conformidad {idx}: {p['pregunta']}
+                                        </div>
+                                        <div style='font-size: 0.85rem; color: #666; font-style: italic; margin-top: 0.5rem;'>
+                                            <strong>Normativa:</strong> {p['normativa']}
+                                        </div>
+                                        <div style='margin-top: 0.5rem; font-size: 0.9rem;'>
+                                            <strong>Categoría:</strong> {p['categoria']}
+                                        </div>
+                                        {f"<div style='margin-top: 0.5rem; font-size: 0.9rem;'>📝 <strong>Observaciones:</strong> {p['observaciones']}</div>" if p['observaciones'] else ""}
+                                    </div>
+                                    """, unsafe_allow_html=True)
+                        else:
+                            st.success("🎉 Todas las preguntas aplicables en esta sección cumplen con la normativa")
+
+                # Sección de exportación a PDF (fragmento: los clics de
+                # exportación no re-ejecutan el resto de la página)
+                st.markdown("---")
+                st.subheader("📤 Exportar Reporte Completo")
+                _export_section(empresa, estadisticas, ultimo_formulario,
+                                observaciones_generales)
+
+                # Resumen ejecutivo
+                st.markdown("---")
+                st.subheader("📋 Resumen Ejecutivo")
+                
+                # Calcular resumen de cumplimiento
+                cumplimiento_total = estadisticas['cumplimiento_promedio']
+                # El backend ya trae el total agrupado; no se vuelve a sumar aquí
+                total_no_conformidades = estadisticas.get('no_cumple_total', 0)
+                
+                if cumplimiento_total >= 80:
+                    st.success(f"🌟 Excelente cumplimiento general: {cumplimiento_total}%")
+                    st.markdown(RESUMEN_ALTO)
+                elif cumplimiento_total >= 50:
+                    st.warning(f"⚠️ Cumplimiento moderado: {cumplimiento_total}%")
+                    st.markdown(RESUMEN_MEDIO_TMPL.format(n=total_no_conformidades))
+                else:
+                    st.error(f"🚨 Bajo cumplimiento: {cumplimiento_total}%")
+                    st.markdown(RESUMEN_BAJO_TMPL.format(n=total_no_conformidades))
+                
+            else:
+                st.warning("⚠️ No hay suficientes datos para generar un reporte completo")
+                st.info("Complete al menos una verificación para generar reportes detallados")
+                
+        except requests.exceptions.Timeout:
+            st.error("🔴 El servidor no respondió a tiempo")
+        except requests.exceptions.RequestException as e:
+            st.error(f"🔴 Error de conexión: {str(e)}")
+            st.warning("Verifique su conexión a internet o intente nuevamente más tarde")
+            
+    else:
+        st.warning("👈 Seleccione una empresa primero en la página de Formulario de Verificación")
+        if st.button("Ir a Formulario de Verificación"):
+            st.switch_page(PAGE_FORMULARIO)
+
+# Navegación nativa: st.navigation evita el dispatch manual por
+# current_page y los st.rerun() encadenados de los botones de menú
+PAGE_DASHBOARD = st.Page(dashboard_page, title="Inicio", icon="🏠", default=True)
+PAGE_GESTION = st.Page(gestion_empresas_page, title="Gestión de Empresas", icon="🏢")
+PAGE_FORMULARIO = st.Page(formulario_verificacion_page, title="Formulario de Verificación", icon="📋")
+PAGE_REPORTES = st.Page(reportes_page, title="Reportes y Estadísticas", icon="📊")
+
+if not st.session_state.app.logged_in:
+    login_page()
+else:
+    pg = st.navigation([PAGE_DASHBOARD, PAGE_GESTION, PAGE_FORMULARIO, PAGE_REPORTES])
+    pg.run()
+